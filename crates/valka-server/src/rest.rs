@@ -35,13 +35,19 @@ enum ApiError {
     Internal(String),
 }
 
-impl IntoResponse for ApiError {
-    fn into_response(self) -> axum::response::Response {
-        let (status, code, message) = match self {
+impl ApiError {
+    fn into_parts(self) -> (StatusCode, &'static str, String) {
+        match self {
             ApiError::NotFound(msg) => (StatusCode::NOT_FOUND, "NOT_FOUND", msg),
             ApiError::InvalidState(msg) => (StatusCode::UNPROCESSABLE_ENTITY, "INVALID_STATE", msg),
             ApiError::Internal(msg) => (StatusCode::INTERNAL_SERVER_ERROR, "INTERNAL_ERROR", msg),
-        };
+        }
+    }
+}
+
+impl IntoResponse for ApiError {
+    fn into_response(self) -> axum::response::Response {
+        let (status, code, message) = self.into_parts();
         (
             status,
             Json(ErrorBody {
@@ -97,6 +103,7 @@ pub fn build_api_router(
             "/api/v1/tasks",
             post(create_task).get(list_tasks).delete(clear_all_tasks),
         )
+        .route("/api/v1/tasks/batch", post(create_tasks_batch))
         .route("/api/v1/tasks/{task_id}", get(get_task).delete(delete_task))
         .route("/api/v1/tasks/{task_id}/cancel", post(cancel_task))
         .route("/api/v1/tasks/{task_id}/signal", post(send_signal))
@@ -175,6 +182,11 @@ struct CreateTaskBody {
     scheduled_at: Option<String>,
 }
 
+#[derive(Deserialize)]
+struct CreateTasksBatchBody {
+    tasks: Vec<CreateTaskBody>,
+}
+
 fn default_max_retries() -> i32 {
     3
 }
@@ -202,6 +214,46 @@ async fn create_task(
     State(state): State<AppState>,
     Json(body): Json<CreateTaskBody>,
 ) -> Result<impl IntoResponse, ApiError> {
+    let task = insert_and_offer_task(&state, body).await?;
+    Ok((StatusCode::CREATED, Json(task)))
+}
+
+/// Create many tasks in one request. Entries are independent: each is
+/// created (or fails) on its own, so one bad entry does not fail the others.
+/// The response array matches the order of the request's `tasks`; a failed
+/// entry is an error object (`error`, `code`, `status`) in its position.
+async fn create_tasks_batch(
+    State(state): State<AppState>,
+    Json(body): Json<CreateTasksBatchBody>,
+) -> impl IntoResponse {
+    let mut results = Vec::with_capacity(body.tasks.len());
+    let mut all_created = true;
+    for task in body.tasks {
+        match insert_and_offer_task(&state, task).await {
+            Ok(created) => results.push(created),
+            Err(e) => {
+                all_created = false;
+                let (status, code, message) = e.into_parts();
+                results.push(serde_json::json!({
+                    "error": message,
+                    "code": code,
+                    "status": status.as_u16(),
+                }));
+            }
+        }
+    }
+    let status = if all_created {
+        StatusCode::CREATED
+    } else {
+        StatusCode::MULTI_STATUS
+    };
+    (status, Json(results))
+}
+
+async fn insert_and_offer_task(
+    state: &AppState,
+    body: CreateTaskBody,
+) -> Result<serde_json::Value, ApiError> {
     let task_id = TaskId::new();
     let partition = partition_for_task(
         &body.queue_name,
@@ -267,7 +319,7 @@ async fn create_task(
             .forward_task(&owner_addr, &task_id.0, &body.queue_name, partition.0)
             .await;
         valka_core::metrics::record_task_forwarded(&body.queue_name);
-        return Ok((StatusCode::CREATED, Json(task_row_to_json(task))));
+        return Ok(task_row_to_json(task));
     }
     // If owner unknown, fall through to local sync match (safety)
 
@@ -289,7 +341,7 @@ async fn create_task(
             .offer_task(&body.queue_name, partition, envelope);
     }
 
-    Ok((StatusCode::CREATED, Json(task_row_to_json(task))))
+    Ok(task_row_to_json(task))
 }
 
 async fn get_task(
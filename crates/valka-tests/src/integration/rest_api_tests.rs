@@ -147,6 +147,71 @@ async fn test_rest_create_task_defaults(pool: PgPool) {
     assert_eq!(body["timeout_seconds"], 300);
 }
 
+// ─── POST /api/v1/tasks/batch ───────────────────────────────────────
+
+#[sqlx::test(migrations = "../../crates/valka-db/migrations")]
+async fn test_rest_create_tasks_batch(pool: PgPool) {
+    let app = build_test_router(pool);
+
+    let resp = app
+        .oneshot(post_json(
+            "/api/v1/tasks/batch",
+            serde_json::json!({
+                "tasks": [
+                    {"queue_name": "demo", "task_name": "first", "input": {"n": 1}},
+                    {"queue_name": "demo", "task_name": "second", "priority": 5}
+                ]
+            }),
+        ))
+        .await
+        .unwrap();
+
+    assert_eq!(resp.status(), StatusCode::CREATED);
+    let body = parse_response_json(resp).await;
+    let tasks = body.as_array().unwrap();
+    assert_eq!(tasks.len(), 2);
+    assert_eq!(tasks[0]["task_name"], "first");
+    assert_eq!(tasks[0]["input"]["n"], 1);
+    assert_eq!(tasks[1]["task_name"], "second");
+    assert_eq!(tasks[1]["priority"], 5);
+    assert_ne!(tasks[0]["id"], tasks[1]["id"]);
+}
+
+#[sqlx::test(migrations = "../../crates/valka-db/migrations")]
+async fn test_rest_create_tasks_batch_partial_failure(pool: PgPool) {
+    let app = build_test_router(pool.clone());
+
+    // The second entry reuses the first entry's idempotency key.
+    let resp = app
+        .oneshot(post_json(
+            "/api/v1/tasks/batch",
+            serde_json::json!({
+                "tasks": [
+                    {"queue_name": "demo", "task_name": "first", "idempotency_key": "dup"},
+                    {"queue_name": "demo", "task_name": "second", "idempotency_key": "dup"},
+                    {"queue_name": "demo", "task_name": "third"}
+                ]
+            }),
+        ))
+        .await
+        .unwrap();
+
+    assert_eq!(resp.status(), StatusCode::MULTI_STATUS);
+    let body = parse_response_json(resp).await;
+    let results = body.as_array().unwrap();
+    assert_eq!(results.len(), 3);
+    assert_eq!(results[0]["task_name"], "first");
+    assert_eq!(results[1]["code"], "INTERNAL_ERROR");
+    assert_eq!(results[1]["status"], 500);
+    assert_eq!(results[2]["task_name"], "third");
+
+    let count: i64 = sqlx::query_scalar("SELECT COUNT(*) FROM tasks WHERE queue_name = 'demo'")
+        .fetch_one(&pool)
+        .await
+        .unwrap();
+    assert_eq!(count, 2);
+}
+
 // ─── GET /api/v1/tasks/{id} ─────────────────────────────────────────
 
 #[sqlx::test(migrations = "../../crates/valka-db/migrations")]
@@ -11,18 +11,23 @@ async def main() -> None:
         health = await client.health_check()
         print(f"Server health: {health}")
 
-        # Create several tasks
-        for i in range(5):
-            task = await client.create_task(
-                queue_name="emails",
-                task_name="send-welcome",
-                input={
-                    "to": f"user{i}@example.com",
-                    "subject": "Welcome to Valka!",
-                },
-                priority=i,
-                max_retries=3,
+        # Create several tasks concurrently
+        created = await asyncio.gather(
+            *(
+                client.create_task(
+                    queue_name="emails",
+                    task_name="send-welcome",
+                    input={
+                        "to": f"user{i}@example.com",
+                        "subject": "Welcome to Valka!",
+                    },
+                    priority=i,
+                    max_retries=3,
+                )
+                for i in range(5)
             )
+        )
+        for task in created:
             print(f"Created task {task['id']} (status={task['status']})")
 
         # List all email tasks
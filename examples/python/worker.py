@@ -3,7 +3,7 @@
 import asyncio
 import logging
 
-from valka import ValkaWorker, TaskContext
+from valka import ValkaWorker, TaskContext, install_uvloop
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
 
@@ -37,4 +37,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
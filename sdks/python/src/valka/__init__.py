@@ -10,6 +10,7 @@ from valka.errors import (
     ShuttingDownError,
     ValkaError,
 )
+from valka.grpc_client import ValkaGrpcClient
 from valka.retry import RetryPolicy
 from valka.types import (
     CreateTaskOptions,
@@ -25,11 +26,12 @@ from valka.types import (
     TaskStatus,
     WorkerInfo,
 )
-from valka.worker import ValkaWorker, ValkaWorkerBuilder
+from valka.worker import ValkaWorker, ValkaWorkerBuilder, install_uvloop
 
 __all__ = [
     # Core classes
     "ValkaClient",
+    "ValkaGrpcClient",
     "ValkaWorker",
     "ValkaWorkerBuilder",
     "TaskContext",
@@ -42,6 +44,7 @@ __all__ = [
     "ShuttingDownError",
     # Utilities
     "RetryPolicy",
+    "install_uvloop",
     # Types
     "Task",
     "TaskRun",
@@ -0,0 +1,119 @@
+"""JSON encode/decode helpers, backed by orjson when it is installed.
+
+The stdlib fallback is kept in step with the orjson options used here, so
+installing the ``fast`` extra does not change which task inputs are
+accepted: both backends take non-string dict keys, NumPy arrays/scalars,
+datetimes, UUIDs, enums and dataclasses, write NaN and infinities as
+``null``, and refuse to parse them. The one difference left is that orjson
+rejects integers outside the 64-bit range.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import enum
+import json
+import math
+import uuid
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+_SEPARATORS = (",", ":")
+# Dict keys json.dumps writes itself; anything else goes through _default.
+_PLAIN_KEYS = (str, int, float, bool, type(None))
+
+
+def _default(obj: Any) -> Any:
+    # NumPy arrays and scalars both expose tolist().
+    tolist = getattr(obj, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _normalize(obj: Any) -> Any:
+    """Rewrite ``obj`` into what json.dumps writes the way orjson does.
+
+    Non-finite floats become None and dict keys json.dumps rejects are
+    converted through _default. Only used once the plain encode has failed.
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, (str, int, type(None))):
+        return obj
+    if isinstance(obj, dict):
+        return {_normalize_key(key): _normalize(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_normalize(item) for item in obj]
+    return _normalize(_default(obj))
+
+
+def _normalize_key(key: Any) -> Any:
+    while not isinstance(key, _PLAIN_KEYS):
+        key = _default(key)
+    if isinstance(key, float) and not math.isfinite(key):
+        return None
+    return key
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` like the orjson backend, using only the stdlib."""
+    try:
+        return json.dumps(
+            obj, separators=_SEPARATORS, default=_default, allow_nan=False
+        ).encode()
+    except (TypeError, ValueError):
+        # NaN or a key json.dumps does not accept; rare, so only then pay
+        # for a rewritten copy.
+        try:
+            normalized = _normalize(obj)
+        except RecursionError:
+            # A circular reference; orjson reports it as a TypeError too.
+            raise TypeError("Recursion limit reached") from None
+        return json.dumps(
+            normalized, separators=_SEPARATORS, default=_default, allow_nan=False
+        ).encode()
+
+
+def _reject_constant(name: str) -> Any:
+    raise ValueError(f"{name} is not valid JSON")
+
+
+def _stdlib_loads(data: bytes | str) -> Any:
+    """Parse JSON like the orjson backend, which rejects NaN and Infinity."""
+    return json.loads(data, parse_constant=_reject_constant)
+
+
+if orjson is not None:
+    _DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=_DUMPS_OPTIONS)
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+else:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+        return _stdlib_dumps(obj)
+
+    def loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return _stdlib_loads(data)
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 from typing import Any
 
 import httpx
 
+from valka import _json
 from valka.errors import ApiError
 from valka.types import (
     CreateTaskOptions,
@@ -19,6 +22,63 @@ from valka.types import (
     WorkerInfo,
 )
 
+_DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0,
+)
+_DEFAULT_TIMEOUT = httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve(api_base: str, path: str) -> httpx.URL:
+    """Build the absolute URL for an API path once.
+
+    httpx re-parses and merges relative paths against ``base_url`` on every
+    request; handing it a ready absolute URL skips that work.
+    """
+    return httpx.URL(api_base + path)
+
+
+_PendingCreate = tuple[CreateTaskOptions, asyncio.Future[Task]]
+_PendingSignal = tuple[str, str, Any, asyncio.Future[dict[str, Any]]]
+_SharedKey = tuple[str, frozenset[tuple[str, str]]]
+
+# Clients handed out by ValkaClient.shared(), per event loop, with the task
+# that closes them when the loop shuts down. The loop is held strongly (a
+# used client's queues and connections refer to it anyway); entries are
+# removed by aclose_shared(), by that task, or, for a loop closed without
+# cancelling its tasks, on the next shared() call.
+_shared_clients: dict[
+    asyncio.AbstractEventLoop,
+    tuple[dict[_SharedKey, ValkaClient], asyncio.Task[None]],
+] = {}
+
+
+async def _close_shared_at_exit(
+    loop: asyncio.AbstractEventLoop, clients: dict[_SharedKey, ValkaClient]
+) -> None:
+    """Wait until cancelled, then close ``loop``'s shared clients.
+
+    asyncio.run() cancels every remaining task before closing its loop, so
+    this runs while the loop can still close connections.
+    """
+    try:
+        await loop.create_future()
+    except asyncio.CancelledError:
+        entry = _shared_clients.get(loop)
+        if entry is not None and entry[0] is clients:
+            del _shared_clients[loop]
+            for client in clients.values():
+                await client._close(drain=False)
+        raise
+
+
+def _forget_closed_loops() -> None:
+    for loop in [loop for loop in _shared_clients if loop.is_closed()]:
+        del _shared_clients[loop]
+
 
 class ValkaClient:
     """Async REST client for the Valka task queue API.
@@ -31,6 +91,25 @@ class ValkaClient:
                 task_name="send-welcome",
                 input={"to": "user@example.com"},
             )
+
+    Concurrent ``create_task`` calls are coalesced: calls arriving within
+    ``linger_ms`` of each other are sent as a single batch request of up to
+    ``batch_size`` tasks. Pass ``batch_size=1`` to disable coalescing.
+    Entries in a batch succeed or fail independently, and several batches
+    may be in flight at once (up to the pool's ``max_connections``).
+
+    Requests share a pool of keep-alive connections; widen ``limits`` for
+    producers that keep many requests in flight. The server speaks plain
+    HTTP/1.1, so HTTP/2 is off by default. Pass ``http2=True`` for an
+    ``https://`` endpoint (e.g. a TLS proxy) that negotiates HTTP/2; it needs
+    the ``http2`` extra.
+
+    ``send_signal_nowait`` hands signals to ``signal_concurrency`` background
+    senders. Signals for the same task always go through the same sender, so
+    they are delivered in submission order.
+
+    Short-lived callers can use :meth:`shared` to reuse one client (and its
+    open connections) per event loop instead of constructing a new one.
     """
 
     def __init__(
@@ -38,12 +117,81 @@ class ValkaClient:
         base_url: str = "http://localhost:8989",
         *,
         headers: dict[str, str] | None = None,
+        batch_size: int = 64,
+        linger_ms: float = 2.0,
+        http2: bool = False,
+        limits: httpx.Limits | None = None,
+        timeout: httpx.Timeout | None = None,
+        signal_concurrency: int = 8,
     ) -> None:
         self._base_url = base_url.rstrip("/")
+        self._api_base = f"{self._base_url}/api/v1"
+        self._healthz_url = httpx.URL(f"{self._base_url}/healthz")
         self._client = httpx.AsyncClient(
-            base_url=f"{self._base_url}/api/v1",
+            base_url=self._api_base,
             headers=headers or {},
+            http2=http2,
+            limits=limits or _DEFAULT_LIMITS,
+            timeout=timeout or _DEFAULT_TIMEOUT,
         )
+        self._batch_size = batch_size
+        self._linger = linger_ms / 1000.0
+        self._pending_creates: asyncio.Queue[_PendingCreate] | None = None
+        self._create_flusher: asyncio.Task[None] | None = None
+        # Batch requests in flight, bounded by the connection pool.
+        self._create_sends: set[asyncio.Task[None]] = set()
+        self._create_slots = asyncio.Semaphore(
+            (limits or _DEFAULT_LIMITS).max_connections or 100
+        )
+        self._signal_concurrency = max(1, signal_concurrency)
+        self._signal_queues: list[asyncio.Queue[_PendingSignal]] = []
+        # One sender per queue, running only while its queue has work.
+        self._signal_senders: list[asyncio.Task[None] | None] = []
+        self._is_shared = False
+
+    @classmethod
+    def shared(
+        cls,
+        base_url: str = "http://localhost:8989",
+        *,
+        headers: dict[str, str] | None = None,
+    ) -> ValkaClient:
+        """Return the client shared by all callers on the running event loop.
+
+        Instances are keyed by ``(base_url, headers)``. ``close()`` is a no-op
+        on a shared client; call :meth:`aclose_shared` at shutdown instead.
+        A loop shut down by ``asyncio.run`` closes its shared clients itself,
+        without sending queued signals.
+        """
+        loop = asyncio.get_running_loop()
+        entry = _shared_clients.get(loop)
+        if entry is None:
+            _forget_closed_loops()
+            clients: dict[_SharedKey, ValkaClient] = {}
+            closer = loop.create_task(_close_shared_at_exit(loop, clients))
+            # Lives as long as the loop; if the loop is closed without
+            # cancelling it, drop it quietly, as run_until_complete does.
+            closer._log_destroy_pending = False  # type: ignore[attr-defined]
+            entry = _shared_clients[loop] = (clients, closer)
+        clients = entry[0]
+        key = (base_url.rstrip("/"), frozenset((headers or {}).items()))
+        client = clients.get(key)
+        if client is None:
+            client = cls(base_url, headers=headers)
+            client._is_shared = True
+            clients[key] = client
+        return client
+
+    @classmethod
+    async def aclose_shared(cls) -> None:
+        """Close every shared client created on the running event loop."""
+        entry = _shared_clients.pop(asyncio.get_running_loop(), None)
+        if entry is None:
+            return
+        clients, closer = entry
+        closer.cancel()
+        for client in clients.values():
+            await client._close()
 
     async def __aenter__(self) -> ValkaClient:
         return self
@@ -52,7 +200,41 @@ class ValkaClient:
         await self.close()
 
     async def close(self) -> None:
-        """Close the underlying HTTP client."""
+        """Close the underlying HTTP client.
+
+        Signals queued with ``send_signal_nowait`` are sent before closing.
+        Does nothing on a client returned by :meth:`shared`.
+        """
+        if not self._is_shared:
+            await self._close()
+
+    async def _close(self, *, drain: bool = True) -> None:
+        if drain:
+            for queue in self._signal_queues:
+                await queue.join()
+        senders = [sender for sender in self._signal_senders if sender is not None]
+        for sender in senders:
+            sender.cancel()
+        await asyncio.gather(*senders, return_exceptions=True)
+        for queue in self._signal_queues:
+            while not queue.empty():
+                queue.get_nowait()[-1].cancel()
+        self._signal_queues = []
+        self._signal_senders = []
+        if self._create_flusher is not None:
+            self._create_flusher.cancel()
+            try:
+                await self._create_flusher
+            except asyncio.CancelledError:
+                pass
+            self._create_flusher = None
+        await asyncio.gather(*self._create_sends, return_exceptions=True)
+        if self._pending_creates is not None:
+            while not self._pending_creates.empty():
+                _, fut = self._pending_creates.get_nowait()
+                if not fut.done():
+                    fut.cancel()
+            self._pending_creates = None
         await self._client.aclose()
 
     # -- Task CRUD --
@@ -81,7 +263,25 @@ class ValkaClient:
         ):
             if key in kwargs:
                 body[key] = kwargs[key]  # type: ignore[literal-required]
-        return await self._post("/tasks", body)
+        if self._batch_size <= 1:
+            return await self._post("/tasks", body)
+        return await self._enqueue_create(body)
+
+    async def create_tasks_batch(
+        self, tasks: list[CreateTaskOptions]
+    ) -> list[Task | ApiError]:
+        """Create several tasks in one request. Results keep the input order.
+
+        Each entry is created independently; an entry that failed is returned
+        as an :class:`ApiError` in its position while the others are created.
+        """
+        results = await self._post("/tasks/batch", {"tasks": tasks})
+        return [
+            ApiError(item["error"], status=item.get("status", 500))
+            if "error" in item
+            else item
+            for item in results
+        ]
 
     async def get_task(self, task_id: str) -> Task:
         """Get a task by ID."""
@@ -159,6 +359,29 @@ class ValkaClient:
             body["payload"] = payload
         return await self._post(f"/tasks/{task_id}/signal", body)
 
+    def send_signal_nowait(
+        self,
+        task_id: str,
+        signal_name: str,
+        payload: Any = None,
+    ) -> asyncio.Future[dict[str, Any]]:
+        """Queue a signal without waiting for the round-trip.
+
+        Returns a future resolved with {signal_id, delivered}, or with the
+        ApiError raised by the server.
+        """
+        if not self._signal_queues:
+            self._signal_queues = [asyncio.Queue() for _ in range(self._signal_concurrency)]
+            self._signal_senders = [None] * self._signal_concurrency
+        fut: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        index = hash(task_id) % len(self._signal_queues)
+        queue = self._signal_queues[index]
+        queue.put_nowait((task_id, signal_name, payload, fut))
+        sender = self._signal_senders[index]
+        if sender is None or sender.done():
+            self._signal_senders[index] = asyncio.create_task(self._send_signals(queue))
+        return fut
+
     async def list_signals(
         self,
         task_id: str,
@@ -174,23 +397,104 @@ class ValkaClient:
 
     async def health_check(self) -> str:
         """Check server health. Returns 'ok' on success."""
-        resp = await self._client.get(f"{self._base_url}/healthz")
+        resp = await self._client.get(self._healthz_url)
         resp.raise_for_status()
         return resp.text
 
     # -- Internal helpers --
 
+    async def _send_signals(self, queue: asyncio.Queue[_PendingSignal]) -> None:
+        # Exits once the queue is empty; send_signal_nowait starts a new
+        # sender for the next signal. At most one runs per queue, which keeps
+        # each task's signals in order.
+        while not queue.empty():
+            task_id, signal_name, payload, fut = queue.get_nowait()
+            try:
+                if not fut.done():
+                    result = await self.send_signal(task_id, signal_name, payload)
+                    if not fut.done():
+                        fut.set_result(result)
+            except Exception as exc:
+                if not fut.done():
+                    fut.set_exception(exc)
+            finally:
+                queue.task_done()
+
+    async def _enqueue_create(self, body: CreateTaskOptions) -> Task:
+        if self._pending_creates is None:
+            self._pending_creates = asyncio.Queue()
+        if self._create_flusher is None or self._create_flusher.done():
+            self._create_flusher = asyncio.create_task(self._flush_creates())
+        fut: asyncio.Future[Task] = asyncio.get_running_loop().create_future()
+        self._pending_creates.put_nowait((body, fut))
+        return await fut
+
+    async def _flush_creates(self) -> None:
+        # Exits once the queue is empty; _enqueue_create starts a new flusher
+        # for the next entry, so an idle client has no pending task.
+        queue = self._pending_creates
+        assert queue is not None
+        while not queue.empty():
+            batch = [queue.get_nowait()]
+            try:
+                if self._linger > 0:
+                    await asyncio.sleep(self._linger)
+                # Batches are sent concurrently; wait only for pool capacity.
+                await self._create_slots.acquire()
+            except asyncio.CancelledError:
+                # close() only reaches entries still queued; this one was
+                # already taken off.
+                for _, fut in batch:
+                    fut.cancel()
+                raise
+            while len(batch) < self._batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            send = asyncio.create_task(self._send_creates(batch))
+            self._create_sends.add(send)
+            send.add_done_callback(self._create_send_done)
+
+    def _create_send_done(self, send: asyncio.Task[None]) -> None:
+        self._create_sends.discard(send)
+        self._create_slots.release()
+
+    async def _send_creates(self, batch: list[_PendingCreate]) -> None:
+        results: list[Task | ApiError]
+        try:
+            if len(batch) == 1:
+                results = [await self._post("/tasks", batch[0][0])]
+            else:
+                results = await self.create_tasks_batch([body for body, _ in batch])
+        except asyncio.CancelledError:
+            for _, fut in batch:
+                fut.cancel()
+            raise
+        except Exception as exc:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        for (_, fut), result in zip(batch, results):
+            if fut.done():
+                continue
+            if isinstance(result, ApiError):
+                fut.set_exception(result)
+            else:
+                fut.set_result(result)
+
     async def _get(self, path: str, *, params: dict[str, Any] | None = None) -> Any:
-        resp = await self._client.get(path, params=params)
+        resp = await self._client.get(_resolve(self._api_base, path), params=params)
         if resp.status_code >= 400:
             raise ApiError(resp.text, status=resp.status_code)
-        return resp.json()
+        return _json.loads(resp.content)
 
     async def _post(self, path: str, body: Any = None) -> Any:
+        url = _resolve(self._api_base, path)
         if body is not None:
-            resp = await self._client.post(path, json=body)
+            resp = await self._client.post(
+                url, content=_json.dumps(body), headers=_JSON_HEADERS
+            )
         else:
-            resp = await self._client.post(path)
+            resp = await self._client.post(url)
         if resp.status_code >= 400:
             raise ApiError(resp.text, status=resp.status_code)
-        return resp.json()
+        return _json.loads(resp.content)
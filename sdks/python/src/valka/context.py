@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import collections
+import logging
 import time
 from dataclasses import dataclass
-from typing import Any, Callable, Awaitable, TYPE_CHECKING
+from typing import Any, Callable, Awaitable
 
-if TYPE_CHECKING:
-    from valka._proto.valka.v1 import worker_pb2
+from valka import _json
+from valka._proto.valka.v1 import worker_pb2
 
+_WorkerRequest = worker_pb2.WorkerRequest
 
-@dataclass
+logger = logging.getLogger("valka.context")
+
+_UNSET: Any = object()
+
+
+@dataclass(slots=True)
 class SignalData:
     """Data from a received signal."""
 
@@ -24,15 +31,52 @@ class SignalData:
         """Parse the signal payload JSON. Returns None if empty."""
         if not self.payload:
             return None
-        return json.loads(self.payload)
+        return _json.loads(self.payload)
+
+
+def _hand_off(waiters: collections.deque[asyncio.Future[Any]], signal: Any) -> bool:
+    """Resolve the oldest live waiter with ``signal``. Returns False if none."""
+    while waiters:
+        fut = waiters.popleft()
+        if not fut.done():
+            fut.set_result(signal)
+            return True
+    return False
 
 
 class TaskContext:
     """Context provided to task handler functions.
 
-    Exposes task metadata, logging, and signal reception methods.
+    Exposes task metadata, logging, and signal reception methods. Log entries
+    are buffered for up to ``log_linger_ms`` (or ``log_max_batch`` entries)
+    and sent to the server as one ``LogBatch``. At most
+    ``signal_buffer_maxsize`` unread signals are kept; beyond that the oldest
+    is dropped.
     """
 
+    __slots__ = (
+        "task_id",
+        "task_run_id",
+        "queue_name",
+        "task_name",
+        "attempt_number",
+        "_raw_input",
+        "_raw_metadata",
+        "_input_cache",
+        "_metadata_cache",
+        "_send_fn",
+        "_signal_fifo",
+        "_signal_index",
+        "_signal_taken",
+        "_name_waiters",
+        "_any_waiters",
+        "_signal_buffer_maxsize",
+        "_log_linger",
+        "_log_max_batch",
+        "_log_buf",
+        "_log_flusher",
+    )
+
     def __init__(
         self,
         *,
@@ -41,9 +85,12 @@ class TaskContext:
         queue_name: str,
         task_name: str,
         attempt_number: int,
-        raw_input: str,
-        raw_metadata: str,
+        raw_input: bytes | str,
+        raw_metadata: bytes | str,
         send_fn: Callable[[worker_pb2.WorkerRequest], Awaitable[None]],
+        log_linger_ms: float = 20.0,
+        log_max_batch: int = 64,
+        signal_buffer_maxsize: int = 1024,
     ) -> None:
         self.task_id = task_id
         self.task_run_id = task_run_id
@@ -52,21 +99,63 @@ class TaskContext:
         self.attempt_number = attempt_number
         self._raw_input = raw_input
         self._raw_metadata = raw_metadata
+        self._input_cache: Any = _UNSET
+        self._metadata_cache: Any = _UNSET
         self._send_fn = send_fn
-        self._signal_queue: asyncio.Queue[Any] = asyncio.Queue()
-        self._signal_buffer: list[Any] = []
+        # Undelivered signals in arrival order, plus a per-name index over the
+        # same objects. Signals taken through the index are recorded in
+        # _signal_taken (by id) and skipped lazily when the FIFO is popped.
+        self._signal_fifo: collections.deque[Any] = collections.deque()
+        self._signal_index: collections.defaultdict[str, collections.deque[Any]] = (
+            collections.defaultdict(collections.deque)
+        )
+        self._signal_taken: set[int] = set()
+        self._name_waiters: dict[str, collections.deque[asyncio.Future[Any]]] = {}
+        self._any_waiters: collections.deque[asyncio.Future[Any]] = collections.deque()
+        self._signal_buffer_maxsize = signal_buffer_maxsize
+        self._log_linger = log_linger_ms / 1000.0
+        self._log_max_batch = log_max_batch
+        # Pending (timestamp_ms, level, message) tuples; LogEntry messages are
+        # built directly inside the outgoing batch on flush.
+        self._log_buf: list[tuple[int, int, str]] = []
+        # One-shot linger timer, started by the first log of each batch.
+        self._log_flusher: asyncio.Task[None] | None = None
+
+    @classmethod
+    def _from_assignment(
+        cls,
+        assignment: worker_pb2.TaskAssignment,
+        send_fn: Callable[[worker_pb2.WorkerRequest], Awaitable[None]],
+    ) -> TaskContext:
+        """Internal: build the context for a ``TaskAssignment`` from the stream."""
+        return cls(
+            task_id=assignment.task_id,
+            task_run_id=assignment.task_run_id,
+            queue_name=assignment.queue_name,
+            task_name=assignment.task_name,
+            attempt_number=assignment.attempt_number,
+            raw_input=assignment.input,
+            raw_metadata=assignment.metadata,
+            send_fn=send_fn,
+        )
 
     def input(self) -> Any:
-        """Parse and return the task input JSON. Returns None if empty."""
-        if not self._raw_input:
-            return None
-        return json.loads(self._raw_input)
+        """Parse and return the task input JSON. Returns None if empty.
+
+        The input is parsed once; later calls return the same object.
+        """
+        if self._input_cache is _UNSET:
+            self._input_cache = _json.loads(self._raw_input) if self._raw_input else None
+        return self._input_cache
 
     def metadata(self) -> dict[str, Any]:
-        """Parse and return the task metadata JSON. Returns {} if empty."""
-        if not self._raw_metadata:
-            return {}
-        return json.loads(self._raw_metadata)
+        """Parse and return the task metadata JSON. Returns {} if empty.
+
+        The metadata is parsed once; later calls return the same object.
+        """
+        if self._metadata_cache is _UNSET:
+            self._metadata_cache = _json.loads(self._raw_metadata) if self._raw_metadata else {}
+        return self._metadata_cache
 
     async def log(self, message: str) -> None:
         """Send an INFO log entry."""
@@ -84,43 +173,85 @@ class TaskContext:
         """Send an ERROR log entry."""
         await self._log_at_level(4, message)
 
+    async def flush_logs(self) -> None:
+        """Send all buffered log entries now as a single batch."""
+        if not self._log_buf:
+            return
+        entries, self._log_buf = self._log_buf, []
+        request = _WorkerRequest()
+        add = request.log_batch.entries.add
+        task_run_id = self.task_run_id
+        for timestamp_ms, level, message in entries:
+            add(task_run_id=task_run_id, timestamp_ms=timestamp_ms, level=level, message=message)
+        await self._send_fn(request)
+
     async def wait_for_signal(self, name: str) -> SignalData:
         """Wait for a signal with the given name. Non-matching signals are buffered."""
-        # Check buffer first
-        for i, sig in enumerate(self._signal_buffer):
-            if sig.signal_name == name:
-                self._signal_buffer.pop(i)
-                await self._send_signal_ack(sig.signal_id)
-                return SignalData(
-                    signal_id=sig.signal_id,
-                    name=sig.signal_name,
-                    payload=sig.payload,
-                )
-
-        # Wait for matching signal
-        while True:
-            sig = await self._signal_queue.get()
-            if sig.signal_name == name:
-                await self._send_signal_ack(sig.signal_id)
-                return SignalData(
-                    signal_id=sig.signal_id,
-                    name=sig.signal_name,
-                    payload=sig.payload,
-                )
-            self._signal_buffer.append(sig)
+        buffered = self._signal_index.get(name)
+        if buffered:
+            sig = buffered.popleft()
+            self._signal_taken.add(id(sig))
+        else:
+            waiters = self._name_waiters.setdefault(name, collections.deque())
+            sig = await self._wait_signal(waiters)
+        return await self._accept_signal(sig)
 
     async def receive_signal(self) -> SignalData:
         """Wait for the next signal (any name). Checks buffer first."""
-        if self._signal_buffer:
-            sig = self._signal_buffer.pop(0)
-            await self._send_signal_ack(sig.signal_id)
-            return SignalData(
-                signal_id=sig.signal_id,
-                name=sig.signal_name,
-                payload=sig.payload,
-            )
-
-        sig = await self._signal_queue.get()
+        sig = self._pop_buffered()
+        if sig is None:
+            sig = await self._wait_signal(self._any_waiters)
+        return await self._accept_signal(sig)
+
+    def _deliver_signal(self, signal: Any) -> None:
+        """Internal: called by the worker to deliver a signal to this context."""
+        waiters = self._name_waiters.get(signal.signal_name)
+        if waiters and _hand_off(waiters, signal):
+            return
+        if self._any_waiters and _hand_off(self._any_waiters, signal):
+            return
+        if len(self._signal_fifo) - len(self._signal_taken) >= self._signal_buffer_maxsize:
+            # Drop the oldest unread signal. It was never acked, so the server
+            # still considers it pending.
+            dropped = self._pop_buffered()
+            if dropped is not None:
+                logger.warning(
+                    "Signal buffer for task %s is full (%d), dropping signal %s",
+                    self.task_id,
+                    self._signal_buffer_maxsize,
+                    dropped.signal_id,
+                )
+        self._signal_fifo.append(signal)
+        self._signal_index[signal.signal_name].append(signal)
+
+    def _pop_buffered(self) -> Any:
+        fifo = self._signal_fifo
+        while fifo:
+            sig = fifo.popleft()
+            if id(sig) in self._signal_taken:
+                self._signal_taken.discard(id(sig))
+                continue
+            # The oldest buffered signal is also the oldest of its name.
+            self._signal_index[sig.signal_name].popleft()
+            return sig
+        return None
+
+    async def _wait_signal(self, waiters: collections.deque[asyncio.Future[Any]]) -> Any:
+        fut: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        waiters.append(fut)
+        try:
+            return await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Handed a signal just as we were cancelled: put it back.
+                sig = fut.result()
+                self._signal_fifo.appendleft(sig)
+                self._signal_index[sig.signal_name].appendleft(sig)
+            elif fut in waiters:
+                waiters.remove(fut)
+            raise
+
+    async def _accept_signal(self, sig: Any) -> SignalData:
         await self._send_signal_ack(sig.signal_id)
         return SignalData(
             signal_id=sig.signal_id,
@@ -128,28 +259,37 @@ class TaskContext:
             payload=sig.payload,
         )
 
-    def _deliver_signal(self, signal: Any) -> None:
-        """Internal: called by the worker to deliver a signal to this context."""
-        self._signal_queue.put_nowait(signal)
+    async def _close(self) -> None:
+        """Internal: called by the worker when the handler finishes."""
+        if self._log_flusher is not None:
+            self._log_flusher.cancel()
+            try:
+                await self._log_flusher
+            except asyncio.CancelledError:
+                pass
+            self._log_flusher = None
+        await self.flush_logs()
 
-    async def _send_signal_ack(self, signal_id: str) -> None:
-        from valka._proto.valka.v1 import worker_pb2
+    async def _flush_logs_later(self) -> None:
+        await asyncio.sleep(self._log_linger)
+        self._log_flusher = None
+        try:
+            await self.flush_logs()
+        except Exception as exc:
+            logger.warning("Failed to send logs for task %s: %s", self.task_id, exc)
 
-        request = worker_pb2.WorkerRequest(
-            signal_ack=worker_pb2.SignalAck(signal_id=signal_id)
-        )
+    async def _send_signal_ack(self, signal_id: str) -> None:
+        # Set fields in place rather than building and copying a nested
+        # SignalAck. A fresh request per call is required because the
+        # stream may await before serializing it.
+        request = _WorkerRequest()
+        request.signal_ack.signal_id = signal_id
         await self._send_fn(request)
 
     async def _log_at_level(self, level: int, message: str) -> None:
-        from valka._proto.valka.v1 import worker_pb2
-
-        entry = worker_pb2.LogEntry(
-            task_run_id=self.task_run_id,
-            timestamp_ms=int(time.time() * 1000),
-            level=level,
-            message=message,
-        )
-        request = worker_pb2.WorkerRequest(
-            log_batch=worker_pb2.LogBatch(entries=[entry])
-        )
-        await self._send_fn(request)
+        self._log_buf.append((time.time_ns() // 1_000_000, level, message))
+        if self._log_linger <= 0 or len(self._log_buf) >= self._log_max_batch:
+            await self.flush_logs()
+            return
+        if self._log_flusher is None:
+            self._log_flusher = asyncio.create_task(self._flush_logs_later())
@@ -0,0 +1,186 @@
+"""Valka gRPC API client."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import grpc
+import grpc.aio
+
+from valka import _json
+from valka._proto.valka.v1 import api_pb2, api_pb2_grpc, common_pb2
+from valka.errors import ApiError
+from valka.types import Task, TaskStatus
+
+# Channel defaults; ``options`` passed to ValkaGrpcClient override per key.
+_CHANNEL_OPTIONS: dict[str, Any] = {
+    "grpc.keepalive_time_ms": 10_000,
+    "grpc.http2.max_pings_without_data": 0,
+    "grpc.use_local_subchannel_pool": 1,
+}
+
+# gRPC status codes mapped onto the HTTP statuses the REST API uses.
+_HTTP_STATUS = {
+    grpc.StatusCode.INVALID_ARGUMENT: 400,
+    grpc.StatusCode.NOT_FOUND: 404,
+    grpc.StatusCode.ALREADY_EXISTS: 409,
+    grpc.StatusCode.FAILED_PRECONDITION: 422,
+    grpc.StatusCode.UNAVAILABLE: 503,
+}
+
+
+class ValkaGrpcClient:
+    """Async gRPC client for the Valka task queue API.
+
+    Mirrors the task and signal methods of :class:`ValkaClient` and returns
+    the same dict shapes, but sends every call over one long-lived HTTP/2
+    channel to the server's gRPC port. ``options`` are gRPC channel
+    arguments; each one overrides the default for its key.
+
+    Usage::
+
+        async with ValkaGrpcClient("localhost:50051") as client:
+            task = await client.create_task(
+                queue_name="emails",
+                task_name="send-welcome",
+                input={"to": "user@example.com"},
+            )
+    """
+
+    def __init__(
+        self,
+        server_addr: str = "localhost:50051",
+        *,
+        options: list[tuple[str, Any]] | None = None,
+    ) -> None:
+        self._channel = grpc.aio.insecure_channel(
+            server_addr, options=list({**_CHANNEL_OPTIONS, **dict(options or ())}.items())
+        )
+        self._stub = api_pb2_grpc.ApiServiceStub(self._channel)
+
+    async def __aenter__(self) -> ValkaGrpcClient:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying gRPC channel."""
+        await self._channel.close()
+
+    # -- Task CRUD --
+
+    async def create_task(
+        self,
+        queue_name: str,
+        task_name: str,
+        input: Any = None,
+        **kwargs: Any,
+    ) -> Task:
+        """Create a new task."""
+        request = api_pb2.CreateTaskRequest(queue_name=queue_name, task_name=task_name)
+        if input is not None:
+            request.input = _json.dumps(input).decode()
+        if kwargs.get("metadata") is not None:
+            request.metadata = _json.dumps(kwargs["metadata"]).decode()
+        for key in (
+            "priority",
+            "max_retries",
+            "timeout_seconds",
+            "idempotency_key",
+            "scheduled_at",
+        ):
+            if kwargs.get(key) is not None:
+                setattr(request, key, kwargs[key])
+        resp = await self._call(self._stub.CreateTask, request)
+        return _task_to_dict(resp.task)
+
+    async def get_task(self, task_id: str) -> Task:
+        """Get a task by ID."""
+        resp = await self._call(self._stub.GetTask, api_pb2.GetTaskRequest(task_id=task_id))
+        return _task_to_dict(resp.task)
+
+    async def list_tasks(
+        self,
+        queue_name: str | None = None,
+        status: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[Task]:
+        """List tasks with optional filters.
+
+        ``status`` is a status name, matched case-insensitively; an unknown
+        name raises ValueError.
+        """
+        request = api_pb2.ListTasksRequest(
+            pagination=common_pb2.Pagination(page_size=limit, page_token=str(offset)),
+        )
+        if queue_name is not None:
+            request.queue_name = queue_name
+        if status is not None:
+            request.status = _status_value(status)
+        resp = await self._call(self._stub.ListTasks, request)
+        return [_task_to_dict(task) for task in resp.tasks]
+
+    async def cancel_task(self, task_id: str) -> Task:
+        """Cancel a task."""
+        resp = await self._call(
+            self._stub.CancelTask, api_pb2.CancelTaskRequest(task_id=task_id)
+        )
+        return _task_to_dict(resp.task)
+
+    # -- Signals --
+
+    async def send_signal(
+        self,
+        task_id: str,
+        signal_name: str,
+        payload: Any = None,
+    ) -> dict[str, Any]:
+        """Send a named signal to a task. Returns {signal_id, delivered}."""
+        request = api_pb2.SendSignalRequest(task_id=task_id, signal_name=signal_name)
+        if payload is not None:
+            request.payload = _json.dumps(payload).decode()
+        resp = await self._call(self._stub.SendSignal, request)
+        return {"signal_id": resp.signal_id, "delivered": resp.delivered}
+
+    # -- Internal helpers --
+
+    async def _call(self, method: Any, request: Any) -> Any:
+        try:
+            return await method(request)
+        except grpc.aio.AioRpcError as exc:
+            raise ApiError(
+                exc.details() or str(exc.code()),
+                status=_HTTP_STATUS.get(exc.code(), 500),
+            ) from exc
+
+
+def _status_value(status: str) -> int:
+    """Map a status name such as ``"pending"`` or ``"PENDING"`` to its enum value."""
+    try:
+        return TaskStatus[status.upper()].value
+    except KeyError:
+        raise ValueError(f"Unknown task status: {status!r}") from None
+
+
+def _task_to_dict(task: common_pb2.TaskMeta) -> Task:
+    """Convert a TaskMeta message into the REST API's task shape."""
+    return {
+        "id": task.id,
+        "queue_name": task.queue_name,
+        "task_name": task.task_name,
+        "status": TaskStatus(task.status).name,
+        "priority": task.priority,
+        "max_retries": task.max_retries,
+        "attempt_count": task.attempt_count,
+        "timeout_seconds": task.timeout_seconds,
+        "idempotency_key": task.idempotency_key or None,
+        "input": _json.loads(task.input) if task.input else None,
+        "metadata": _json.loads(task.metadata) if task.metadata else None,
+        "output": _json.loads(task.output) if task.output else None,
+        "error_message": task.error_message or None,
+        "scheduled_at": task.scheduled_at or None,
+        "created_at": task.created_at,
+        "updated_at": task.updated_at,
+    }
@@ -4,9 +4,21 @@ from __future__ import annotations
 
 import random
 
+_random = random.Random().random
+
+# Capped delays precomputed per policy. A schedule that has not settled on
+# a repeating value by then (e.g. a multiplier below 1, which decays) falls
+# back to the formula for later attempts.
+_MAX_SCHEDULE = 64
+
 
 class RetryPolicy:
-    """Exponential backoff with jitter for reconnection."""
+    """Exponential backoff with jitter for reconnection.
+
+    The delay for attempt ``n`` is ``min(initial_delay_ms * multiplier ** n,
+    max_delay_ms)`` plus up to 10% jitter. Capped delays are precomputed;
+    setting any of the three parameters rebuilds them.
+    """
 
     def __init__(
         self,
@@ -14,17 +26,53 @@ class RetryPolicy:
         max_delay_ms: float = 30_000,
         multiplier: float = 2.0,
     ) -> None:
-        self.initial_delay_ms = initial_delay_ms
-        self.max_delay_ms = max_delay_ms
-        self.multiplier = multiplier
+        self._initial_delay_ms = initial_delay_ms
+        self._max_delay_ms = max_delay_ms
+        self._multiplier = multiplier
         self._attempt = 0
+        self._schedule: list[float] = []
+        self._settled = False
+        self._build_schedule()
+
+    @property
+    def initial_delay_ms(self) -> float:
+        return self._initial_delay_ms
+
+    @initial_delay_ms.setter
+    def initial_delay_ms(self, value: float) -> None:
+        self._initial_delay_ms = value
+        self._build_schedule()
+
+    @property
+    def max_delay_ms(self) -> float:
+        return self._max_delay_ms
+
+    @max_delay_ms.setter
+    def max_delay_ms(self, value: float) -> None:
+        self._max_delay_ms = value
+        self._build_schedule()
+
+    @property
+    def multiplier(self) -> float:
+        return self._multiplier
+
+    @multiplier.setter
+    def multiplier(self, value: float) -> None:
+        self._multiplier = value
+        self._build_schedule()
 
     def next_delay(self) -> float:
         """Calculate and return the next delay in milliseconds."""
-        delay = self.initial_delay_ms * (self.multiplier ** self._attempt)
-        capped = min(delay, self.max_delay_ms)
-        jitter = capped * 0.1 * random.random()
-        self._attempt += 1
+        attempt = self._attempt
+        schedule = self._schedule
+        if attempt < len(schedule):
+            capped = schedule[attempt]
+        elif self._settled:
+            capped = schedule[-1]
+        else:
+            capped = self._capped(attempt)
+        jitter = capped * 0.1 * _random()
+        self._attempt = attempt + 1
         return capped + jitter
 
     def next_delay_seconds(self) -> float:
@@ -34,3 +82,25 @@ class RetryPolicy:
     def reset(self) -> None:
         """Reset the attempt counter (call on successful connection)."""
         self._attempt = 0
+
+    def _capped(self, attempt: int) -> float:
+        return min(self._initial_delay_ms * self._multiplier**attempt, self._max_delay_ms)
+
+    def _build_schedule(self) -> None:
+        # Stop once the delay repeats forever: a multiplier of 1, a growing
+        # delay that reached the cap, or a non-growing one that reached 0.
+        multiplier = self._multiplier
+        schedule: list[float] = []
+        settled = False
+        while len(schedule) < _MAX_SCHEDULE:
+            capped = self._capped(len(schedule))
+            schedule.append(capped)
+            if (
+                multiplier == 1
+                or (multiplier > 1 and capped == self._max_delay_ms)
+                or (multiplier >= 0 and capped == 0)
+            ):
+                settled = True
+                break
+        self._schedule = schedule
+        self._settled = settled
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import collections
 import logging
+import os
 import signal
+import sys
 import time
-import uuid
 from typing import Any, Awaitable, Callable
 
 import grpc
 import grpc.aio
 
+from valka import _json
+from valka._proto.valka.v1 import worker_pb2, worker_pb2_grpc
 from valka.context import TaskContext
 from valka.errors import ConnectionError, HandlerError
 from valka.retry import RetryPolicy
@@ -21,6 +24,88 @@ logger = logging.getLogger("valka.worker")
 
 TaskHandler = Callable[[TaskContext], Awaitable[Any]]
 
+# Upper bound on queued requests drained per writer wake-up.
+_MAX_WRITE_BATCH = 256
+# The server keeps tonic's default 4 MiB limit on each received message.
+_MAX_MESSAGE_BYTES = 4 * 1024 * 1024
+# Adjacent log batches are merged up to this serialized size, well under
+# _MAX_MESSAGE_BYTES; an oversized message would end the stream.
+_MAX_MERGED_LOG_BYTES = 1024 * 1024
+# Default for how long one batch write may take before the transport is
+# considered stalled and the session is reconnected.
+_DEFAULT_WRITE_TIMEOUT_S = 30.0
+# The server deregisters a worker after 30s without a heartbeat.
+_HEARTBEAT_INTERVAL_S = 10.0
+
+# Session channel defaults, tuned for throughput: larger HTTP/2 frames and
+# flow-control lookahead keep assignments flowing on high-RTT links, and the
+# write buffer lets gRPC coalesce small outbound frames. The channel lives
+# across sessions, so gRPC's own reconnect backoff re-establishes the
+# transport. Override per key with ValkaWorkerBuilder.channel_options().
+_CHANNEL_OPTIONS: dict[str, Any] = {
+    "grpc.keepalive_time_ms": 10_000,
+    "grpc.keepalive_timeout_ms": 5_000,
+    "grpc.initial_reconnect_backoff_ms": 100,
+    "grpc.max_reconnect_backoff_ms": 30_000,
+    "grpc.optimization_target": "throughput",
+    "grpc.http2.bdp_probe": 1,
+    "grpc.http2.max_frame_size": 4 * 1024 * 1024,
+    "grpc.http2.lookahead_bytes": 2 * 1024 * 1024,
+    "grpc.http2.write_buffer_size": 64 * 1024,
+    # Match the server's limit so an oversized message fails here rather
+    # than ending the stream on the server.
+    "grpc.max_send_message_length": _MAX_MESSAGE_BYTES,
+    "grpc.max_receive_message_length": 16 * 1024 * 1024,
+}
+
+_WorkerRequest = worker_pb2.WorkerRequest
+_SHUTDOWN_REQUEST = _WorkerRequest(
+    shutdown=worker_pb2.GracefulShutdown(reason="client shutdown")
+)
+
+
+def _new_worker_id() -> str:
+    """Return a random UUID4 string without building a uuid.UUID."""
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _encode_output(result: Any) -> str:
+    # str and bytes results are taken as already-encoded JSON.
+    if isinstance(result, str):
+        return result
+    if isinstance(result, (bytes, bytearray)):
+        return result.decode()
+    return _json.dumps(result).decode()
+
+
+async def _write_all(stream: Any, unsent: collections.deque[Any]) -> None:
+    # Pop only after each write completes, so whatever is left in ``unsent``
+    # after a failure, timeout or cancellation was not written.
+    while unsent:
+        await stream.write(unsent[0])
+        unsent.popleft()
+
+
+def install_uvloop() -> bool:
+    """Make uvloop the event loop for subsequent ``asyncio.run`` calls.
+
+    Call it before starting the loop that runs the worker. Returns False,
+    leaving the default loop in place, when uvloop is not installed (it is
+    part of the ``fast`` extra) or on Windows, where it is unavailable.
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 
 class ValkaWorker:
     """gRPC bidirectional streaming worker for processing tasks.
@@ -49,6 +134,8 @@ class ValkaWorker:
         concurrency: int,
         metadata: dict[str, Any] | None,
         handler: TaskHandler,
+        channel_options: dict[str, Any] | None = None,
+        write_timeout_s: float = _DEFAULT_WRITE_TIMEOUT_S,
     ) -> None:
         self._worker_id = worker_id
         self._name = name
@@ -56,14 +143,47 @@ class ValkaWorker:
         self._queues = queues
         self._concurrency = concurrency
         self._metadata = metadata
+        # Built once; reconnects only refresh the concurrency field, which
+        # set_concurrency may have changed.
+        self._hello = _WorkerRequest()
+        self._hello.hello.worker_id = worker_id
+        self._hello.hello.worker_name = name
+        self._hello.hello.queues.extend(queues)
+        self._hello.hello.metadata = _json.dumps(metadata).decode() if metadata else ""
         self._handler = handler
-
-        self._semaphore = asyncio.Semaphore(concurrency)
-        self._active_tasks: dict[str, asyncio.Task[None]] = {}
+        self._channel_options = list({**_CHANNEL_OPTIONS, **(channel_options or {})}.items())
+        self._write_timeout_s = write_timeout_s
+
+        # Concurrency slots: the tasks currently holding one, plus FIFO
+        # waiters. A slot is handed to a waiter synchronously on release (see
+        # _grant_slots), so there is no notify for a cancelled waiter to
+        # swallow. A task gives its slot back as soon as its handler returns,
+        # before the result is written.
+        self._slot_holders: set[asyncio.Task[Any]] = set()
+        self._slot_waiters: collections.deque[
+            tuple[asyncio.Task[Any], asyncio.Future[None]]
+        ] = collections.deque()
+        # Running handler tasks; each task is named after its task ID.
+        self._active_tasks: set[asyncio.Task[None]] = set()
+        # Done callback bound once rather than per assignment.
+        self._on_task_done = self._task_done
+        # Bumped whenever _active_tasks changes; lets heartbeats reuse the
+        # previous ID snapshot when nothing was assigned or finished.
+        self._tasks_version = 0
         self._task_contexts: dict[str, TaskContext] = {}
+        # Tasks with a registered context, per queue; kept in step with
+        # _task_contexts so reads never scan the active set.
+        self._inflight_by_queue: dict[str, int] = dict.fromkeys(queues, 0)
         self._shutting_down = False
         self._shutdown_event = asyncio.Event()
+        self._shutdown_task: asyncio.Task[None] | None = None
+        self._channel: grpc.aio.Channel | None = None
         self._stream: grpc.aio.StreamStreamCall | None = None  # type: ignore[type-arg]
+        # Outgoing requests, written to the stream by a single writer task.
+        # A deque rather than a Queue so a failed write can put its unsent
+        # requests back at the front; they survive into the next session.
+        self._outbox: collections.deque[Any] = collections.deque()
+        self._outbox_ready = asyncio.Event()
 
     @staticmethod
     def builder() -> ValkaWorkerBuilder:
@@ -81,7 +201,7 @@ class ValkaWorker:
         handler: TaskHandler,
     ) -> ValkaWorker:
         """Create a worker directly without builder."""
-        worker_id = str(uuid.uuid4())
+        worker_id = _new_worker_id()
         return ValkaWorker(
             worker_id=worker_id,
             name=name or f"python-worker-{worker_id[:8]}",
@@ -96,18 +216,41 @@ class ValkaWorker:
         """Start the worker. Blocks until shutdown or unrecoverable error."""
         loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, lambda: asyncio.ensure_future(self.shutdown()))
+            loop.add_signal_handler(sig, self._start_shutdown)
 
+        # One channel for the worker's lifetime; each reconnect only opens a
+        # new Session stream on it.
+        self._channel = grpc.aio.insecure_channel(
+            self._server_addr, options=self._channel_options
+        )
+        stub = worker_pb2_grpc.WorkerServiceStub(self._channel)
         retry = RetryPolicy()
-        while not self._shutting_down:
-            try:
-                await self._session(retry)
-            except Exception as exc:
-                if self._shutting_down:
-                    break
-                delay = retry.next_delay_seconds()
-                logger.warning("Connection lost (%s), reconnecting in %.1fs", exc, delay)
-                await asyncio.sleep(delay)
+        try:
+            while not self._shutting_down:
+                try:
+                    await self._session(stub, retry)
+                except Exception as exc:
+                    if self._shutting_down:
+                        break
+                    delay = retry.next_delay_seconds()
+                    logger.warning("Connection lost (%s), reconnecting in %.1fs", exc, delay)
+                    await asyncio.sleep(delay)
+        finally:
+            await self._channel.close()
+            self._channel = None
+
+    def inflight_by_queue(self) -> dict[str, int]:
+        """Return the number of assigned, unfinished tasks for each queue."""
+        return dict(self._inflight_by_queue)
+
+    async def set_concurrency(self, n: int) -> None:
+        """Change the max number of concurrent task handlers.
+
+        Takes effect immediately for new assignments; running tasks are not
+        interrupted. The server learns the new value on the next reconnect.
+        """
+        self._concurrency = n
+        self._grant_slots()
 
     async def shutdown(self) -> None:
         """Initiate graceful shutdown."""
@@ -116,57 +259,35 @@ class ValkaWorker:
         self._shutting_down = True
         logger.info("Shutting down, draining %d active tasks...", len(self._active_tasks))
 
-        # Send graceful shutdown message
-        if self._stream is not None:
-            try:
-                from valka._proto.valka.v1 import worker_pb2
-
-                request = worker_pb2.WorkerRequest(
-                    graceful_shutdown=worker_pb2.GracefulShutdown(reason="client shutdown")
-                )
-                await self._stream.write(request)
-            except Exception:
-                pass
-
         # Wait up to 30s for active tasks to drain
         if self._active_tasks:
-            tasks = list(self._active_tasks.values())
+            tasks = list(self._active_tasks)
             try:
                 await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=30)
             except asyncio.TimeoutError:
                 logger.warning("Drain timeout, cancelling %d tasks", len(self._active_tasks))
-                for task in self._active_tasks.values():
+                for task in self._active_tasks:
                     task.cancel()
 
+        # Announce shutdown after the drain: the server stops reading the
+        # stream when it sees this, so queued results must go out first.
+        if self._stream is not None:
+            await self._send(_SHUTDOWN_REQUEST)
+
         self._shutdown_event.set()
 
-    async def _session(self, retry: RetryPolicy) -> None:
-        from valka._proto.valka.v1 import worker_pb2, worker_pb2_grpc
-
-        channel = grpc.aio.insecure_channel(
-            self._server_addr,
-            options=[
-                ("grpc.keepalive_time_ms", 10_000),
-                ("grpc.keepalive_timeout_ms", 5_000),
-            ],
-        )
+    def _start_shutdown(self) -> None:
+        """Run shutdown() in the background; used from signal and stream handlers."""
+        if self._shutdown_task is None:
+            self._shutdown_task = asyncio.get_running_loop().create_task(self.shutdown())
 
+    async def _session(self, stub: worker_pb2_grpc.WorkerServiceStub, retry: RetryPolicy) -> None:
         try:
-            stub = worker_pb2_grpc.WorkerServiceStub(channel)
             self._stream = stub.Session()
 
             # Send hello
-            meta_str = json.dumps(self._metadata) if self._metadata else ""
-            hello = worker_pb2.WorkerRequest(
-                hello=worker_pb2.WorkerHello(
-                    worker_id=self._worker_id,
-                    worker_name=self._name,
-                    queues=self._queues,
-                    concurrency=self._concurrency,
-                    metadata=meta_str,
-                )
-            )
-            await self._stream.write(hello)
+            self._hello.hello.concurrency = self._concurrency
+            await self._stream.write(self._hello)
 
             retry.reset()
             logger.info(
@@ -177,86 +298,204 @@ class ValkaWorker:
                 self._concurrency,
             )
 
-            # Start heartbeat task
+            # Start writer and heartbeat tasks
+            writer_task = asyncio.create_task(self._writer_loop(self._stream))
             heartbeat_task = asyncio.create_task(self._heartbeat_loop())
 
             try:
+                # Dispatch never awaits, so the reader is never held up. It
+                # keeps reading while shutting down so signals and
+                # cancellations still reach draining tasks; the server ends the
+                # stream once it receives the shutdown notice.
                 async for response in self._stream:
-                    if self._shutting_down:
-                        break
-                    await self._handle_response(response)
+                    self._handle_response(response)
+            except asyncio.CancelledError:
+                # A failed write cancels the call locally, which grpc.aio
+                # surfaces here as a cancellation; that case is turned into a
+                # ConnectionError below. Anything else is a real cancellation.
+                if not writer_task.done():
+                    raise
             finally:
-                heartbeat_task.cancel()
-                try:
-                    await heartbeat_task
-                except asyncio.CancelledError:
-                    pass
+                for task in (heartbeat_task, writer_task):
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
+
+            write_error = None if writer_task.cancelled() else writer_task.result()
+            if write_error is not None:
+                raise ConnectionError(f"stream write failed: {write_error}") from write_error
         finally:
-            await channel.close()
-            self._stream = None
+            # The channel outlives this session; end the call explicitly.
+            if self._stream is not None:
+                self._stream.cancel()
+                self._stream = None
 
     async def _heartbeat_loop(self) -> None:
-        from valka._proto.valka.v1 import worker_pb2
-
-        while not self._shutting_down:
-            await asyncio.sleep(10)
+        # The server extends leases only for the IDs listed in each heartbeat,
+        # so every heartbeat carries the full set; only rebuilding it is skipped.
+        snapshot = worker_pb2.Heartbeat()
+        snapshot_version = -1
+        # Runs until _session cancels it, including through a shutdown drain:
+        # the stream stays open then, and a worker that stopped heartbeating
+        # would be deregistered while its tasks still wait on signals.
+        while self._stream is not None:
+            await asyncio.sleep(_HEARTBEAT_INTERVAL_S)
             if self._stream is None:
                 break
             try:
-                heartbeat = worker_pb2.WorkerRequest(
-                    heartbeat=worker_pb2.Heartbeat(
-                        active_task_ids=list(self._active_tasks.keys()),
-                        timestamp_ms=int(time.time() * 1000),
+                if snapshot_version != self._tasks_version:
+                    snapshot = worker_pb2.Heartbeat(
+                        active_task_ids=[task.get_name() for task in self._active_tasks]
                     )
-                )
-                await self._stream.write(heartbeat)
+                    snapshot_version = self._tasks_version
+                heartbeat = _WorkerRequest()
+                heartbeat.heartbeat.CopyFrom(snapshot)
+                heartbeat.heartbeat.timestamp_ms = time.time_ns() // 1_000_000
+                await self._send(heartbeat)
             except Exception:
                 break
 
-    async def _handle_response(self, response: Any) -> None:
-        kind = response.WhichOneof("response")
-        if kind == "task_assignment":
-            await self._handle_task_assignment(response.task_assignment)
-        elif kind == "task_signal":
+    async def _writer_loop(self, stream: Any) -> BaseException:
+        """Write queued requests to the stream, merging adjacent log batches.
+
+        A merged batch stops growing at _MAX_MERGED_LOG_BYTES. Runs until
+        cancelled or a write fails. On failure the unsent requests go back to
+        the front of the outbox, the call is cancelled, and the error is
+        returned for _session to raise.
+        """
+        outbox = self._outbox
+        ready = self._outbox_ready
+        timeout = self._write_timeout_s
+        while True:
+            while not outbox:
+                ready.clear()
+                await ready.wait()
+            pending = [outbox.popleft() for _ in range(min(len(outbox), _MAX_WRITE_BATCH))]
+
+            merged: list[Any] = []
+            merged_log_bytes = 0
+            for request in pending:
+                if request.HasField("log_batch"):
+                    size = request.ByteSize()
+                    if (
+                        merged
+                        and merged[-1].HasField("log_batch")
+                        and merged_log_bytes + size <= _MAX_MERGED_LOG_BYTES
+                    ):
+                        merged[-1].log_batch.entries.extend(request.log_batch.entries)
+                        merged_log_bytes += size
+                        continue
+                    merged_log_bytes = size
+                merged.append(request)
+
+            unsent = collections.deque(merged)
+            error: BaseException
+            try:
+                await asyncio.wait_for(_write_all(stream, unsent), timeout)
+                continue
+            except asyncio.TimeoutError:
+                error = ConnectionError(f"write stalled for {timeout:g}s")
+            except asyncio.CancelledError:
+                outbox.extendleft(reversed(unsent))
+                raise
+            except Exception as exc:
+                error = exc
+            outbox.extendleft(reversed(unsent))
+            logger.warning("Stream write failed (%s), closing session", error)
+            stream.cancel()
+            return error
+
+    def _handle_response(self, response: Any) -> None:
+        # HasField checks, most frequent message first, are cheaper than
+        # WhichOneof plus a string comparison chain.
+        if response.HasField("task_assignment"):
+            self._handle_task_assignment(response.task_assignment)
+        elif response.HasField("task_signal"):
             self._handle_task_signal(response.task_signal)
-        elif kind == "task_cancellation":
+        elif response.HasField("heartbeat_ack"):
+            pass
+        elif response.HasField("task_cancellation"):
             self._handle_task_cancellation(response.task_cancellation)
-        elif kind == "server_shutdown":
+        elif response.HasField("server_shutdown"):
             logger.info("Server shutdown: %s", response.server_shutdown.reason)
-            await self.shutdown()
-        elif kind == "heartbeat_ack":
-            pass
+            # Drain in the background so the reader keeps delivering signals
+            # and cancellations to the tasks being drained.
+            self._start_shutdown()
 
-    async def _handle_task_assignment(self, assignment: Any) -> None:
-        await self._semaphore.acquire()
-        task = asyncio.create_task(self._execute_task(assignment))
-        self._active_tasks[assignment.task_id] = task
-        task.add_done_callback(lambda _t: self._task_done(assignment.task_id))
+    def _handle_task_assignment(self, assignment: Any) -> None:
+        if self._shutting_down:
+            # The server keeps refilling slots until the post-drain shutdown
+            # notice; hand each refill straight back as a retryable failure
+            # instead of leaving it to expire its lease.
+            self._queue_result(
+                assignment, success=False, retryable=True, error_message="worker shutting down"
+            )
+            return
+        # The slot is acquired inside the task, so a saturated worker keeps
+        # reading its stream instead of stalling HTTP/2 flow control.
+        task = asyncio.create_task(self._execute_task(assignment), name=assignment.task_id)
+        self._active_tasks.add(task)
+        self._tasks_version += 1
+        task.add_done_callback(self._on_task_done)
 
     def _handle_task_signal(self, signal: Any) -> None:
         ctx = self._task_contexts.get(signal.task_id)
         if ctx is not None:
             ctx._deliver_signal(signal)
 
-    def _task_done(self, task_id: str) -> None:
-        self._active_tasks.pop(task_id, None)
-        self._task_contexts.pop(task_id, None)
-        self._semaphore.release()
+    def _handle_task_cancellation(self, cancellation: Any) -> None:
+        for task in self._active_tasks:
+            if task.get_name() == cancellation.task_id:
+                logger.info("Task %s cancelled: %s", cancellation.task_id, cancellation.reason)
+                task.cancel()
+                break
+
+    def _task_done(self, task: asyncio.Task[None]) -> None:
+        self._active_tasks.discard(task)
+        self._tasks_version += 1
+        ctx = self._task_contexts.pop(task.get_name(), None)
+        if ctx is not None:
+            self._inflight_by_queue[ctx.queue_name] -= 1
+        # Normally a no-op; _execute_task releases once its handler returns.
+        self._release_slot(task)
+
+    async def _acquire_slot(self, task: asyncio.Task[Any]) -> None:
+        if not self._slot_waiters and len(self._slot_holders) < self._concurrency:
+            self._slot_holders.add(task)
+            return
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._slot_waiters.append((task, fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            # Granted a slot just before the cancellation landed: pass it on.
+            self._release_slot(task)
+            raise
+
+    def _release_slot(self, task: asyncio.Task[Any]) -> None:
+        if task in self._slot_holders:
+            self._slot_holders.discard(task)
+            self._grant_slots()
+
+    def _grant_slots(self) -> None:
+        waiters = self._slot_waiters
+        while waiters and len(self._slot_holders) < self._concurrency:
+            task, fut = waiters.popleft()
+            if not fut.done():  # skip waiters cancelled while queued
+                self._slot_holders.add(task)
+                fut.set_result(None)
 
     async def _execute_task(self, assignment: Any) -> None:
-        from valka._proto.valka.v1 import worker_pb2
-
-        ctx = TaskContext(
-            task_id=assignment.task_id,
-            task_run_id=assignment.task_run_id,
-            queue_name=assignment.queue_name,
-            task_name=assignment.task_name,
-            attempt_number=assignment.attempt_number,
-            raw_input=assignment.input,
-            raw_metadata=assignment.metadata,
-            send_fn=self._send,
-        )
+        ctx = TaskContext._from_assignment(assignment, self._send)
         self._task_contexts[assignment.task_id] = ctx
+        inflight = self._inflight_by_queue
+        inflight[ctx.queue_name] = inflight.get(ctx.queue_name, 0) + 1
+
+        this_task = asyncio.current_task()
+        assert this_task is not None
+        await self._acquire_slot(this_task)
 
         success = False
         retryable = True
@@ -265,9 +504,9 @@ class ValkaWorker:
 
         try:
             result = await self._handler(ctx)
-            success = True
             if result is not None:
-                output = json.dumps(result) if not isinstance(result, str) else result
+                output = _encode_output(result)
+            success = True
         except HandlerError as exc:
             retryable = exc.retryable
             error_message = str(exc)
@@ -275,22 +514,51 @@ class ValkaWorker:
         except Exception as exc:
             error_message = str(exc)
             logger.warning("Task %s failed: %s", assignment.task_id, exc)
+        finally:
+            self._release_slot(this_task)
+            await ctx._close()
+
+        self._queue_result(
+            assignment,
+            success=success,
+            retryable=retryable,
+            output=output,
+            error_message=error_message,
+        )
 
-        result_msg = worker_pb2.WorkerRequest(
-            task_result=worker_pb2.TaskResult(
-                task_id=assignment.task_id,
-                task_run_id=assignment.task_run_id,
-                success=success,
-                retryable=retryable,
-                output=output,
-                error_message=error_message,
+    def _queue_result(
+        self,
+        assignment: Any,
+        *,
+        success: bool,
+        retryable: bool,
+        output: str = "",
+        error_message: str = "",
+    ) -> None:
+        result_msg = _WorkerRequest()
+        task_result = result_msg.task_result
+        task_result.task_id = assignment.task_id
+        task_result.task_run_id = assignment.task_run_id
+        task_result.success = success
+        task_result.retryable = retryable
+        task_result.output = output
+        task_result.error_message = error_message
+        size = result_msg.ByteSize()
+        if size > _MAX_MESSAGE_BYTES:
+            # It could never be sent, and would be retried on every reconnect.
+            logger.warning("Task %s result is %d bytes, over the limit", assignment.task_id, size)
+            task_result.success = False
+            task_result.retryable = False
+            task_result.output = ""
+            task_result.error_message = (
+                f"task result is {size} bytes, over the {_MAX_MESSAGE_BYTES} byte message limit"
             )
-        )
-        await self._send(result_msg)
+        self._outbox.append(result_msg)
+        self._outbox_ready.set()
 
     async def _send(self, request: Any) -> None:
-        if self._stream is not None:
-            await self._stream.write(request)
+        self._outbox.append(request)
+        self._outbox_ready.set()
 
 
 class ValkaWorkerBuilder:
@@ -303,6 +571,8 @@ class ValkaWorkerBuilder:
         self._concurrency: int = 1
         self._metadata: dict[str, Any] | None = None
         self._handler: TaskHandler | None = None
+        self._channel_options: dict[str, Any] = {}
+        self._write_timeout_s: float = _DEFAULT_WRITE_TIMEOUT_S
 
     def name(self, name: str) -> ValkaWorkerBuilder:
         """Set the worker display name."""
@@ -334,6 +604,16 @@ class ValkaWorkerBuilder:
         self._handler = fn
         return self
 
+    def channel_options(self, options: dict[str, Any]) -> ValkaWorkerBuilder:
+        """Override gRPC channel arguments, e.g. smaller windows for latency."""
+        self._channel_options.update(options)
+        return self
+
+    def write_timeout(self, seconds: float) -> ValkaWorkerBuilder:
+        """Reconnect when one batch write to the stream takes longer than this."""
+        self._write_timeout_s = seconds
+        return self
+
     def build(self) -> ValkaWorker:
         """Build the worker. Raises ValueError if queues or handler missing."""
         if not self._queues:
@@ -341,7 +621,7 @@ class ValkaWorkerBuilder:
         if self._handler is None:
             raise ValueError("A handler function is required")
 
-        worker_id = str(uuid.uuid4())
+        worker_id = _new_worker_id()
         return ValkaWorker(
             worker_id=worker_id,
             name=self._name or f"python-worker-{worker_id[:8]}",
@@ -350,4 +630,6 @@ class ValkaWorkerBuilder:
             concurrency=self._concurrency,
             metadata=self._metadata,
             handler=self._handler,
+            channel_options=self._channel_options,
+            write_timeout_s=self._write_timeout_s,
         )
@@ -0,0 +1,230 @@
+"""REST client create coalescing and shared clients."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from valka import ApiError, ValkaClient
+from valka import client as client_mod
+
+
+def _client(handler: Any, **kwargs: Any) -> ValkaClient:
+    client = ValkaClient("http://valka.test", **kwargs)
+    client._client = httpx.AsyncClient(
+        base_url="http://valka.test/api/v1", transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def _batch_response(request: httpx.Request) -> httpx.Response:
+    """Fail entries named "bad" the way the server reports per-entry errors."""
+    results: list[dict[str, Any]] = []
+    for i, task in enumerate(json.loads(request.content)["tasks"]):
+        if task["task_name"] == "bad":
+            results.append({"error": "duplicate key", "code": "INTERNAL_ERROR", "status": 500})
+        else:
+            results.append({"id": str(i), **task})
+    failed = any("error" in r for r in results)
+    return httpx.Response(207 if failed else 201, json=results)
+
+
+async def test_coalesced_creates_share_one_batch_request() -> None:
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return _batch_response(request)
+
+    client = _client(handler)
+    tasks = await asyncio.gather(*(client.create_task("q", f"t{i}") for i in range(5)))
+    await client.close()
+
+    assert [t["task_name"] for t in tasks] == [f"t{i}" for i in range(5)]
+    assert paths == ["/api/v1/tasks/batch"]
+
+
+async def test_batch_with_one_failing_entry_only_fails_that_caller() -> None:
+    client = _client(_batch_response)
+    names = ["t0", "t1", "bad", "t3"]
+    results = await asyncio.gather(
+        *(client.create_task("q", name) for name in names), return_exceptions=True
+    )
+    await client.close()
+
+    assert isinstance(results[2], ApiError)
+    assert results[2].status == 500
+    assert [r["task_name"] for i, r in enumerate(results) if i != 2] == ["t0", "t1", "t3"]
+
+
+async def test_create_tasks_batch_returns_errors_in_position() -> None:
+    client = _client(_batch_response)
+    results = await client.create_tasks_batch(
+        [
+            {"queue_name": "q", "task_name": "bad"},
+            {"queue_name": "q", "task_name": "ok"},
+        ]
+    )
+    await client.close()
+
+    assert isinstance(results[0], ApiError)
+    assert not isinstance(results[1], ApiError)
+    assert results[1]["task_name"] == "ok"
+
+
+async def test_batches_are_sent_concurrently() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return _batch_response(request)
+
+    client = _client(handler, batch_size=4, linger_ms=0)
+    await asyncio.gather(*(client.create_task("q", f"t{i}") for i in range(12)))
+    await client.close()
+
+    assert peak > 1
+
+
+async def test_whole_batch_failure_reaches_every_caller() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503, text="unavailable")
+
+    client = _client(handler)
+    results = await asyncio.gather(
+        *(client.create_task("q", f"t{i}") for i in range(3)), return_exceptions=True
+    )
+    await client.close()
+
+    assert all(isinstance(r, ApiError) and r.status == 503 for r in results)
+
+
+async def test_batch_size_one_posts_directly() -> None:
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(201, json={"id": "1", **json.loads(request.content)})
+
+    client = _client(handler, batch_size=1)
+    task = await client.create_task("q", "solo")
+    await client.close()
+
+    assert task["task_name"] == "solo"
+    assert paths == ["/api/v1/tasks"]
+
+
+async def test_close_during_linger_cancels_the_taken_entry() -> None:
+    client = _client(_batch_response, linger_ms=50)
+    create = asyncio.create_task(client.create_task("q", "t0"))
+    await asyncio.sleep(0.01)
+    await client.close()
+
+    done, _ = await asyncio.wait({create}, timeout=1)
+    assert create in done
+    assert create.cancelled()
+
+
+# -- Background signals --
+
+
+async def test_send_signal_nowait_keeps_per_task_order() -> None:
+    seen: dict[str, list[str]] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        task_id = request.url.path.split("/")[-2]
+        name = json.loads(request.content)["signal_name"]
+        # Later signals answer faster, so any reordering would show.
+        await asyncio.sleep(0.01 / (int(name) + 1))
+        seen.setdefault(task_id, []).append(name)
+        return httpx.Response(200, json={"signal_id": name, "delivered": True})
+
+    client = _client(handler, signal_concurrency=4)
+    futures = [
+        client.send_signal_nowait(f"task-{i % 3}", str(i // 3)) for i in range(15)
+    ]
+    results = await asyncio.gather(*futures)
+    await client.close()
+
+    assert seen == {f"task-{t}": [str(n) for n in range(5)] for t in range(3)}
+    assert [r["signal_id"] for r in results] == [str(i // 3) for i in range(15)]
+
+
+async def test_close_sends_queued_signals_first() -> None:
+    sent: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content)["signal_name"])
+        if request.url.path.startswith("/api/v1/tasks/missing/"):
+            return httpx.Response(404, text="task not found")
+        return httpx.Response(200, json={"signal_id": "s", "delivered": False})
+
+    client = _client(handler)
+    ok = client.send_signal_nowait("t", "a")
+    missing = client.send_signal_nowait("missing", "b")
+    await client.close()
+
+    assert sorted(sent) == ["a", "b"]
+    assert ok.result() == {"signal_id": "s", "delivered": False}
+    assert isinstance(missing.exception(), ApiError)
+    assert missing.exception().status == 404
+
+
+# -- Shared clients --
+
+
+def _use_shared() -> Any:
+    async def use() -> ValkaClient:
+        client = ValkaClient.shared("http://valka.test")
+        client._client = httpx.AsyncClient(
+            base_url="http://valka.test/api/v1", transport=httpx.MockTransport(_batch_response)
+        )
+        await asyncio.gather(*(client.create_task("q", f"t{i}") for i in range(3)))
+        return client
+
+    return use()
+
+
+async def test_shared_returns_one_client_per_key() -> None:
+    first = ValkaClient.shared("http://valka.test/")
+    assert ValkaClient.shared("http://valka.test") is first
+    assert ValkaClient.shared("http://valka.test", headers={"x": "1"}) is not first
+
+    await first.close()
+    assert not first._client.is_closed
+    await ValkaClient.aclose_shared()
+    assert first._client.is_closed
+    assert ValkaClient.shared("http://valka.test") is not first
+    await ValkaClient.aclose_shared()
+
+
+def test_shared_clients_are_closed_with_their_loop() -> None:
+    clients = [asyncio.run(_use_shared()) for _ in range(3)]
+
+    assert not client_mod._shared_clients
+    assert all(client._client.is_closed for client in clients)
+
+
+def test_loops_closed_without_shutdown_are_forgotten(caplog: pytest.LogCaptureFixture) -> None:
+    for _ in range(3):
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(_use_shared())
+        loop.close()
+
+    async def count() -> int:
+        ValkaClient.shared("http://valka.test")
+        return len(client_mod._shared_clients)
+
+    assert asyncio.run(count()) == 1
+    gc.collect()
+    assert "destroyed but it is pending" not in caplog.text
@@ -0,0 +1,145 @@
+"""TaskContext input parsing, signal buffering and log batching."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from valka import TaskContext, _json
+from valka._proto.valka.v1 import worker_pb2
+
+
+def _context(sent: list[Any], **kwargs: Any) -> TaskContext:
+    async def send(request: Any) -> None:
+        sent.append(request)
+
+    kwargs.setdefault("raw_input", "")
+    kwargs.setdefault("raw_metadata", "")
+    return TaskContext(
+        task_id="t",
+        task_run_id="r",
+        queue_name="q",
+        task_name="test",
+        attempt_number=1,
+        send_fn=send,
+        **kwargs,
+    )
+
+
+def _signal(signal_id: str, name: str) -> worker_pb2.TaskSignal:
+    return worker_pb2.TaskSignal(task_id="t", signal_id=signal_id, signal_name=name)
+
+
+def test_input_and_metadata_are_parsed_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[Any] = []
+    loads = _json.loads
+
+    def counting_loads(data: Any) -> Any:
+        calls.append(data)
+        return loads(data)
+
+    monkeypatch.setattr(_json, "loads", counting_loads)
+    ctx = _context([], raw_input=b'{"n": 1}', raw_metadata='{"m": 2}')
+
+    assert ctx.input() == {"n": 1}
+    assert ctx.input() is ctx.input()
+    assert ctx.metadata() is ctx.metadata()
+    assert calls == [b'{"n": 1}', '{"m": 2}']
+
+
+def test_empty_input_and_metadata_defaults() -> None:
+    ctx = _context([])
+    assert ctx.input() is None
+    assert ctx.metadata() == {}
+    assert ctx.metadata() is ctx.metadata()
+
+
+async def test_wait_for_signal_takes_by_name_and_keeps_order_for_the_rest() -> None:
+    sent: list[Any] = []
+    ctx = _context(sent)
+    for i, name in enumerate("abab"):
+        ctx._deliver_signal(_signal(str(i), name))
+
+    assert (await ctx.wait_for_signal("b")).signal_id == "1"
+    assert (await ctx.receive_signal()).signal_id == "0"
+    assert (await ctx.receive_signal()).signal_id == "2"
+    assert (await ctx.wait_for_signal("b")).signal_id == "3"
+    assert [r.signal_ack.signal_id for r in sent] == ["1", "0", "2", "3"]
+
+
+async def test_waiters_receive_signals_as_they_arrive() -> None:
+    ctx = _context([])
+    by_name = asyncio.create_task(ctx.wait_for_signal("z"))
+    any_name = asyncio.create_task(ctx.receive_signal())
+    await asyncio.sleep(0)
+
+    ctx._deliver_signal(_signal("1", "z"))
+    ctx._deliver_signal(_signal("2", "y"))
+    assert (await by_name).signal_id == "1"
+    assert (await any_name).signal_id == "2"
+
+
+async def test_cancelled_waiter_does_not_swallow_signal() -> None:
+    ctx = _context([])
+    waiter = asyncio.create_task(ctx.wait_for_signal("q"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+
+    ctx._deliver_signal(_signal("1", "q"))
+    assert (await ctx.receive_signal()).signal_id == "1"
+
+
+async def test_full_signal_buffer_drops_oldest() -> None:
+    ctx = _context([], signal_buffer_maxsize=2)
+    for i in range(3):
+        ctx._deliver_signal(_signal(str(i), "s"))
+
+    assert (await ctx.receive_signal()).signal_id == "1"
+    assert (await ctx.receive_signal()).signal_id == "2"
+
+
+async def test_full_signal_buffer_skips_signals_already_taken_by_name() -> None:
+    ctx = _context([], signal_buffer_maxsize=2)
+    ctx._deliver_signal(_signal("0", "a"))
+    ctx._deliver_signal(_signal("1", "b"))
+    assert (await ctx.wait_for_signal("a")).signal_id == "0"
+
+    # Only "1" is unread, so there is room for "2" without dropping.
+    ctx._deliver_signal(_signal("2", "c"))
+    assert (await ctx.receive_signal()).signal_id == "1"
+    assert (await ctx.receive_signal()).signal_id == "2"
+
+
+async def test_logs_are_sent_as_one_batch() -> None:
+    sent: list[Any] = []
+    ctx = _context(sent, log_linger_ms=5)
+    await ctx.log("one")
+    await ctx.log("two")
+    assert not sent
+
+    await asyncio.sleep(0.02)
+    assert len(sent) == 1
+    assert [e.message for e in sent[0].log_batch.entries] == ["one", "two"]
+
+
+async def test_full_log_batch_is_sent_without_waiting() -> None:
+    sent: list[Any] = []
+    ctx = _context(sent, log_max_batch=2)
+    await ctx.log("one")
+    await ctx.error("two")
+
+    assert len(sent) == 1
+    assert [e.level for e in sent[0].log_batch.entries] == [2, 4]
+
+
+async def test_close_flushes_buffered_logs() -> None:
+    sent: list[Any] = []
+    ctx = _context(sent, log_linger_ms=1000)
+    await ctx.log("one")
+    await ctx._close()
+
+    assert [e.message for e in sent[0].log_batch.entries] == ["one"]
+    assert sent[0].log_batch.entries[0].task_run_id == "r"
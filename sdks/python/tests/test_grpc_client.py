@@ -0,0 +1,116 @@
+"""ValkaGrpcClient against an in-process ApiService."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import grpc
+import grpc.aio
+import pytest
+
+from valka import ApiError
+from valka import grpc_client as grpc_client_mod
+from valka._proto.valka.v1 import api_pb2, api_pb2_grpc, common_pb2
+from valka.grpc_client import ValkaGrpcClient, _task_to_dict
+from valka.types import TaskStatus
+
+
+class _Api(api_pb2_grpc.ApiServiceServicer):
+    """Echoes created tasks and records ListTasks filters."""
+
+    def __init__(self) -> None:
+        self.list_requests: list[Any] = []
+
+    async def CreateTask(self, request: Any, context: Any) -> Any:
+        task = common_pb2.TaskMeta(
+            id="t1",
+            queue_name=request.queue_name,
+            task_name=request.task_name,
+            status=common_pb2.TASK_STATUS_PENDING,
+            input=request.input,
+            metadata=request.metadata,
+            priority=request.priority,
+        )
+        return api_pb2.CreateTaskResponse(task=task)
+
+    async def GetTask(self, request: Any, context: Any) -> Any:
+        await context.abort(grpc.StatusCode.NOT_FOUND, f"task {request.task_id} not found")
+
+    async def CancelTask(self, request: Any, context: Any) -> Any:
+        await context.abort(grpc.StatusCode.INTERNAL, "boom")
+
+    async def ListTasks(self, request: Any, context: Any) -> Any:
+        self.list_requests.append(request)
+        return api_pb2.ListTasksResponse()
+
+
+@pytest.fixture
+async def client() -> Any:
+    api = _Api()
+    server = grpc.aio.server()
+    api_pb2_grpc.add_ApiServiceServicer_to_server(api, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    client = ValkaGrpcClient(f"127.0.0.1:{port}")
+    client.api = api  # type: ignore[attr-defined]
+    yield client
+    await client.close()
+    await server.stop(None)
+
+
+async def test_create_task_returns_the_rest_shape(client: ValkaGrpcClient) -> None:
+    task = await client.create_task("q", "send", input={"to": "a"}, metadata={"k": 1}, priority=5)
+
+    assert task["id"] == "t1"
+    assert task["status"] == "PENDING"
+    assert task["input"] == {"to": "a"}
+    assert task["metadata"] == {"k": 1}
+    assert task["priority"] == 5
+    assert task["output"] is None
+    assert task["idempotency_key"] is None
+
+
+@pytest.mark.parametrize("status", ["pending", "PENDING", "Pending"])
+async def test_list_tasks_accepts_any_case_status(client: ValkaGrpcClient, status: str) -> None:
+    await client.list_tasks(status=status)
+    (request,) = client.api.list_requests  # type: ignore[attr-defined]
+    assert request.status == common_pb2.TASK_STATUS_PENDING
+
+
+async def test_list_tasks_rejects_unknown_status(client: ValkaGrpcClient) -> None:
+    with pytest.raises(ValueError, match="bogus"):
+        await client.list_tasks(status="bogus")
+    assert not client.api.list_requests  # type: ignore[attr-defined]
+
+
+async def test_status_codes_map_to_http_statuses(client: ValkaGrpcClient) -> None:
+    with pytest.raises(ApiError) as not_found:
+        await client.get_task("missing")
+    assert not_found.value.status == 404
+    assert "missing" in str(not_found.value)
+
+    with pytest.raises(ApiError) as internal:
+        await client.cancel_task("t1")
+    assert internal.value.status == 500
+
+
+def test_task_to_dict_names_every_status() -> None:
+    for status in TaskStatus:
+        task = _task_to_dict(common_pb2.TaskMeta(id="t", status=status.value))
+        assert task["status"] == status.name
+
+
+async def test_options_override_defaults_per_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, Any] = {}
+    real_insecure_channel = grpc.aio.insecure_channel
+
+    def insecure_channel(target: str, options: Any) -> Any:
+        captured.update(options)
+        return real_insecure_channel(target)
+
+    monkeypatch.setattr(grpc_client_mod.grpc.aio, "insecure_channel", insecure_channel)
+    client = ValkaGrpcClient("localhost:1", options=[("grpc.keepalive_time_ms", 5_000), ("x", 1)])
+    await client.close()
+
+    expected = {**grpc_client_mod._CHANNEL_OPTIONS, "grpc.keepalive_time_ms": 5_000, "x": 1}
+    assert captured == expected
@@ -0,0 +1,82 @@
+"""Parity between the orjson and stdlib JSON backends."""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import enum
+import uuid
+from typing import Any
+
+import pytest
+
+from valka import _json
+
+orjson = pytest.importorskip("orjson")
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class Level(enum.IntEnum):
+    HIGH = 3
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: float
+
+
+_UTC = datetime.timezone.utc
+_IST = datetime.timezone(datetime.timedelta(hours=5, minutes=30))
+
+CASES: list[Any] = [
+    {"a": [1, 2.5, True, None, "x"]},
+    (1, "two"),
+    {1: "int", 1.5: "float", True: "bool", None: "none"},
+    datetime.datetime(2024, 1, 2, 3, 4, 5),
+    datetime.datetime(2024, 1, 2, 3, 4, 5, 678, tzinfo=_UTC),
+    datetime.datetime(2024, 1, 2, tzinfo=_IST),
+    datetime.date(2024, 1, 2),
+    datetime.time(3, 4, 5, 6),
+    uuid.UUID(int=1),
+    {"color": Color.RED, "level": Level.HIGH},
+    Point(1, 2.0),
+    float("nan"),
+    {"values": [float("inf"), -float("inf"), 1.0]},
+    Point(1, float("nan")),
+    {datetime.date(2024, 1, 2): 1, uuid.UUID(int=2): 2, Color.RED: 3},
+    {float("nan"): "key"},
+]
+
+
+@pytest.mark.parametrize("value", CASES, ids=repr)
+def test_backends_encode_the_same(value: Any) -> None:
+    assert _json._stdlib_dumps(value) == orjson.dumps(value, option=_json._DUMPS_OPTIONS)
+
+
+@pytest.mark.parametrize("value", [{1, 2}, b"raw", object()], ids=repr)
+def test_backends_reject_the_same(value: Any) -> None:
+    with pytest.raises(TypeError):
+        orjson.dumps(value, option=_json._DUMPS_OPTIONS)
+    with pytest.raises(TypeError):
+        _json._stdlib_dumps(value)
+
+
+def test_circular_reference_is_a_type_error() -> None:
+    loop: list[Any] = []
+    loop.append(loop)
+    with pytest.raises(TypeError):
+        orjson.dumps(loop, option=_json._DUMPS_OPTIONS)
+    with pytest.raises(TypeError):
+        _json._stdlib_dumps(loop)
+
+
+@pytest.mark.parametrize("text", ["NaN", "[Infinity]", '{"a": -Infinity}'])
+def test_backends_refuse_to_parse_non_finite_numbers(text: str) -> None:
+    with pytest.raises(ValueError):
+        orjson.loads(text)
+    with pytest.raises(ValueError):
+        _json._stdlib_loads(text)
@@ -0,0 +1,63 @@
+"""RetryPolicy backoff schedule."""
+
+from __future__ import annotations
+
+import pytest
+
+from valka import retry
+from valka.retry import RetryPolicy
+
+
+def _formula(initial: float, maximum: float, multiplier: float, attempt: int) -> float:
+    # The per-call computation the precomputed schedule replaced.
+    return min(initial * (multiplier**attempt), maximum)
+
+
+@pytest.fixture
+def no_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(retry, "_random", lambda: 0.0)
+
+
+@pytest.mark.parametrize(
+    ("initial", "maximum", "multiplier"),
+    [
+        (100, 30_000, 2.0),
+        (100, 30_000, 1.5),
+        (250, 1_000, 1.0),
+        (100, 30_000, 0.5),
+        (100, 30_000, 0.99),
+        (100, 30_000, 0.0),
+        (0, 30_000, 2.0),
+        (50_000, 30_000, 2.0),
+    ],
+)
+@pytest.mark.usefixtures("no_jitter")
+def test_schedule_matches_the_formula(initial: float, maximum: float, multiplier: float) -> None:
+    policy = RetryPolicy(initial, maximum, multiplier)
+    delays = [policy.next_delay() for _ in range(200)]
+    assert delays == [_formula(initial, maximum, multiplier, n) for n in range(200)]
+
+
+@pytest.mark.usefixtures("no_jitter")
+def test_setting_parameters_rebuilds_the_schedule() -> None:
+    policy = RetryPolicy(100, 30_000, 2.0)
+    policy.multiplier = 3.0
+    policy.initial_delay_ms = 10
+    policy.max_delay_ms = 500
+    assert [policy.next_delay() for _ in range(6)] == [10, 30, 90, 270, 500, 500]
+
+
+@pytest.mark.usefixtures("no_jitter")
+def test_reset_restarts_the_schedule() -> None:
+    policy = RetryPolicy()
+    policy.next_delay()
+    policy.next_delay()
+    policy.reset()
+    assert policy.next_delay() == 100
+
+
+def test_jitter_adds_up_to_ten_percent() -> None:
+    policy = RetryPolicy(1_000, 1_000, 2.0)
+    delays = [policy.next_delay() for _ in range(100)]
+    assert all(1_000 <= delay < 1_100 for delay in delays)
+    assert policy.next_delay_seconds() < 1.1
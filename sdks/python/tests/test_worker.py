@@ -0,0 +1,308 @@
+"""Worker concurrency, writer and shutdown behaviour."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import grpc.aio
+import pytest
+
+import valka.worker as worker_mod
+from valka import ValkaWorker
+from valka._proto.valka.v1 import worker_pb2, worker_pb2_grpc
+
+
+def _assignment(task_id: str, queue_name: str = "q") -> worker_pb2.TaskAssignment:
+    return worker_pb2.TaskAssignment(
+        task_id=task_id,
+        task_run_id=f"run-{task_id}",
+        queue_name=queue_name,
+        task_name="test",
+        attempt_number=1,
+    )
+
+
+async def _handler(ctx: Any) -> dict[str, str]:
+    return {"task": ctx.task_id}
+
+
+def _task(worker: ValkaWorker, task_id: str) -> asyncio.Task[Any]:
+    return next(t for t in worker._active_tasks if t.get_name() == task_id)
+
+
+# -- Concurrency slots --
+
+
+async def test_cancelled_slot_waiter_passes_slot_on() -> None:
+    started: list[str] = []
+    release_a = asyncio.Event()
+
+    async def handler(ctx: Any) -> None:
+        started.append(ctx.task_id)
+        if ctx.task_id == "a":
+            await release_a.wait()
+
+    worker = ValkaWorker.create(queues=["q"], handler=handler, concurrency=1)
+    for task_id in ("a", "b", "c"):
+        worker._handle_task_assignment(_assignment(task_id))
+    await asyncio.sleep(0)
+    assert started == ["a"]
+
+    # Finishing "a" grants its slot to "b"; cancel "b" before it resumes.
+    release_a.set()
+    task_b = _task(worker, "b")
+    while task_b not in worker._slot_holders:
+        await asyncio.sleep(0)
+    task_b.cancel()
+
+    await asyncio.sleep(0.05)
+    assert started == ["a", "c"]
+    assert not worker._active_tasks
+    assert not worker._slot_holders
+
+
+async def test_cancel_while_queued_for_slot() -> None:
+    release = asyncio.Event()
+
+    async def handler(ctx: Any) -> None:
+        await release.wait()
+
+    worker = ValkaWorker.create(queues=["q"], handler=handler, concurrency=1)
+    worker._handle_task_assignment(_assignment("a"))
+    worker._handle_task_assignment(_assignment("b"))
+    await asyncio.sleep(0)
+
+    task_b = _task(worker, "b")
+    worker._handle_task_cancellation(worker_pb2.TaskCancellation(task_id="b"))
+    await asyncio.gather(task_b, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert task_b.cancelled()
+    assert [t.get_name() for t in worker._active_tasks] == ["a"]
+
+    release.set()
+    await asyncio.sleep(0.01)
+    assert not worker._active_tasks
+    assert not worker._slot_holders
+
+
+async def test_set_concurrency_admits_waiters() -> None:
+    running = 0
+    peak = 0
+
+    async def handler(ctx: Any) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+
+    worker = ValkaWorker.create(queues=["q"], handler=handler, concurrency=1)
+    for i in range(4):
+        worker._handle_task_assignment(_assignment(str(i)))
+    await asyncio.sleep(0)
+    await worker.set_concurrency(3)
+    await asyncio.sleep(0.1)
+    assert peak == 3
+    assert not worker._active_tasks
+
+
+# -- Writer --
+
+
+class _RecordingStream:
+    def __init__(self) -> None:
+        self.written: list[Any] = []
+
+    async def write(self, request: Any) -> None:
+        self.written.append(request)
+
+    def cancel(self) -> None:
+        pass
+
+
+async def test_writer_merges_adjacent_log_batches() -> None:
+    stream = _RecordingStream()
+    worker = ValkaWorker.create(queues=["q"], handler=_handler)
+    for message in ("a", "b"):
+        request = worker_pb2.WorkerRequest()
+        request.log_batch.entries.add(message=message)
+        await worker._send(request)
+    ack = worker_pb2.WorkerRequest()
+    ack.signal_ack.signal_id = "s"
+    await worker._send(ack)
+
+    writer = asyncio.create_task(worker._writer_loop(stream))
+    await asyncio.sleep(0.01)
+    writer.cancel()
+    assert [r.WhichOneof("request") for r in stream.written] == ["log_batch", "signal_ack"]
+    assert [e.message for e in stream.written[0].log_batch.entries] == ["a", "b"]
+
+
+async def test_writer_caps_merged_log_batch_size() -> None:
+    stream = _RecordingStream()
+    worker = ValkaWorker.create(queues=["q"], handler=_handler)
+    for _ in range(5):
+        request = worker_pb2.WorkerRequest()
+        request.log_batch.entries.add(message="x" * (300 * 1024))
+        await worker._send(request)
+
+    writer = asyncio.create_task(worker._writer_loop(stream))
+    await asyncio.sleep(0.01)
+    writer.cancel()
+    assert [len(r.log_batch.entries) for r in stream.written] == [3, 2]
+    assert all(r.ByteSize() <= worker_mod._MAX_MERGED_LOG_BYTES for r in stream.written)
+
+
+class _Server(worker_pb2_grpc.WorkerServiceServicer):
+    """Assigns one task on the first session and records task results."""
+
+    def __init__(self) -> None:
+        self.addr = ""
+        self.sessions = 0
+        self.results: list[tuple[int, str]] = []
+        self.heartbeats: list[list[str]] = []
+
+    async def Session(self, request_iterator: Any, context: Any) -> Any:
+        self.sessions += 1
+        session = self.sessions
+        async for request in request_iterator:
+            if request.HasField("hello") and session == 1:
+                response = worker_pb2.WorkerResponse()
+                response.task_assignment.CopyFrom(_assignment("t1"))
+                yield response
+            elif request.HasField("heartbeat"):
+                self.heartbeats.append(list(request.heartbeat.active_task_ids))
+            elif request.HasField("task_result"):
+                self.results.append((session, request.task_result.task_id))
+            elif request.HasField("shutdown"):
+                return
+
+
+async def _run_until_result(worker: ValkaWorker, server: _Server) -> None:
+    run = asyncio.create_task(worker.run())
+    try:
+        for _ in range(100):
+            if server.results:
+                break
+            await asyncio.sleep(0.05)
+    finally:
+        await worker.shutdown()
+        await asyncio.wait_for(run, 5)
+
+
+@pytest.fixture
+async def server() -> Any:
+    servicer = _Server()
+    srv = grpc.aio.server()
+    worker_pb2_grpc.add_WorkerServiceServicer_to_server(servicer, srv)
+    port = srv.add_insecure_port("127.0.0.1:0")
+    await srv.start()
+    servicer.addr = f"127.0.0.1:{port}"
+    yield servicer
+    await srv.stop(None)
+
+
+async def test_write_failure_reconnects_and_keeps_result(
+    server: _Server, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    write_all = worker_mod._write_all
+    failures = [RuntimeError("write failed")]
+
+    async def flaky_write_all(stream: Any, unsent: Any) -> None:
+        if failures:
+            raise failures.pop()
+        await write_all(stream, unsent)
+
+    monkeypatch.setattr(worker_mod, "_write_all", flaky_write_all)
+    worker = ValkaWorker.create(server_addr=server.addr, queues=["q"], handler=_handler)
+    await _run_until_result(worker, server)
+
+    assert server.sessions >= 2
+    assert server.results == [(2, "t1")]
+
+
+async def test_stalled_write_reconnects(
+    server: _Server, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    write_all = worker_mod._write_all
+    stalls = [True]
+
+    async def stalling_write_all(stream: Any, unsent: Any) -> None:
+        if stalls:
+            stalls.pop()
+            await asyncio.sleep(10)
+        await write_all(stream, unsent)
+
+    monkeypatch.setattr(worker_mod, "_write_all", stalling_write_all)
+    worker = (
+        ValkaWorker.builder()
+        .server_addr(server.addr)
+        .queues(["q"])
+        .handler(_handler)
+        .write_timeout(0.2)
+        .build()
+    )
+    await _run_until_result(worker, server)
+
+    assert server.results == [(2, "t1")]
+
+
+async def test_oversized_result_is_failed_instead_of_sent() -> None:
+    worker = ValkaWorker.create(queues=["q"], handler=_handler)
+    output = "x" * (worker_mod._MAX_MESSAGE_BYTES + 1)
+    worker._queue_result(_assignment("big"), success=True, retryable=True, output=output)
+
+    (request,) = worker._outbox
+    assert request.ByteSize() <= worker_mod._MAX_MESSAGE_BYTES
+    assert request.task_result.success is False
+    assert request.task_result.retryable is False
+    assert request.task_result.output == ""
+
+
+# -- Shutdown --
+
+
+async def test_assignment_during_drain_is_returned_retryable() -> None:
+    async def handler(ctx: Any) -> None:
+        await asyncio.sleep(0.05)
+
+    worker = ValkaWorker.create(queues=["q"], handler=handler)
+    worker._handle_task_assignment(_assignment("running"))
+    shutdown = asyncio.create_task(worker.shutdown())
+    await asyncio.sleep(0)
+    worker._handle_task_assignment(_assignment("late"))
+    await shutdown
+
+    results = {
+        r.task_result.task_id: r.task_result for r in worker._outbox if r.HasField("task_result")
+    }
+    assert results["late"].success is False
+    assert results["late"].retryable is True
+    assert results["late"].error_message == "worker shutting down"
+    assert results["running"].success is True
+    assert worker.inflight_by_queue() == {"q": 0}
+
+
+async def test_heartbeats_continue_while_draining(
+    server: _Server, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(worker_mod, "_HEARTBEAT_INTERVAL_S", 0.05)
+    started = asyncio.Event()
+
+    async def handler(ctx: Any) -> None:
+        started.set()
+        await asyncio.sleep(0.3)
+
+    worker = ValkaWorker.create(server_addr=server.addr, queues=["q"], handler=handler)
+    run = asyncio.create_task(worker.run())
+    await asyncio.wait_for(started.wait(), 5)
+    shutdown = asyncio.create_task(worker.shutdown())
+    await asyncio.sleep(0)
+    before = len(server.heartbeats)
+    await shutdown
+    await asyncio.wait_for(run, 5)
+
+    # Not just the one already due when shutdown began.
+    assert server.heartbeats[before:].count(["t1"]) >= 3
+    assert server.results == [(1, "t1")]